@@ -10,11 +10,172 @@ Algorithm uses entry-weighted approach where all price movements
 are measured relative to the initial entry price.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
-import pytz
-
-UTC_TZ = pytz.UTC
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+UTC_TZ = timezone.utc
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC_TZ)
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_MINUTE = 60 * _NS_PER_SECOND
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """Convert a timezone-aware datetime to integer epoch nanoseconds."""
+    # Exact integer arithmetic; float timestamp() would lose microseconds
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _scan_prefixes_loop(
+    low: np.ndarray,
+    high: np.ndarray,
+    ts: np.ndarray,
+    entry: float,
+    cutoffs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Single fused pass emitting drawdown/MFE/recovery snapshots per cutoff.
+
+    Timeframe windows all start at entry, so each is a prefix of the next.
+    One chronological fold over the bars is snapshotted as it crosses each
+    cutoff instead of rescanning every window. Written as a plain loop over
+    raw arrays so Numba can compile it. The recovery candidate is reset
+    whenever the drawdown deepens, so it always refers to the first bar after
+    the current lowest LOW with HIGH >= entry.
+
+    Args:
+        low: LOW prices, sorted by ``ts`` and starting at the entry bar
+        high: HIGH prices aligned with ``ts``
+        ts: Bar timestamps in epoch nanoseconds
+        entry: Entry price
+        cutoffs: Ascending window ends in epoch nanoseconds (inclusive)
+
+    Returns:
+        Tuple of int64 arrays aligned with ``cutoffs``: (bar_count,
+        drawdown_idx, mfe_idx, recovery_idx); indexes are -1 when not found
+    """
+    n_cutoffs = cutoffs.shape[0]
+    bar_counts = np.zeros(n_cutoffs, dtype=np.int64)
+    drawdown_idxs = np.full(n_cutoffs, -1, dtype=np.int64)
+    mfe_idxs = np.full(n_cutoffs, -1, dtype=np.int64)
+    recovery_idxs = np.full(n_cutoffs, -1, dtype=np.int64)
+
+    n_bars = ts.shape[0]
+    i = 0
+    drawdown_idx = -1
+    mfe_idx = -1
+    recovery_idx = -1
+    min_low = entry
+    max_high = entry
+
+    for c in range(n_cutoffs):
+        while i < n_bars and ts[i] <= cutoffs[c]:
+            if drawdown_idx < 0 or low[i] < min_low:
+                min_low = low[i]
+                drawdown_idx = i
+                recovery_idx = -1
+            elif recovery_idx < 0 and high[i] >= entry:
+                recovery_idx = i
+
+            if mfe_idx < 0 or high[i] > max_high:
+                max_high = high[i]
+                mfe_idx = i
+
+            i += 1
+
+        bar_counts[c] = i
+        drawdown_idxs[c] = drawdown_idx
+        mfe_idxs[c] = mfe_idx
+        recovery_idxs[c] = recovery_idx
+
+    return bar_counts, drawdown_idxs, mfe_idxs, recovery_idxs
+
+
+def _scan_prefixes_numpy(
+    low: np.ndarray,
+    high: np.ndarray,
+    ts: np.ndarray,
+    entry: float,
+    cutoffs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized equivalent of _scan_prefixes_loop used when Numba is missing.
+
+    Running extremes come from ufunc accumulates; the index of the extreme
+    for every prefix is the last bar that strictly set a new extreme, which
+    matches the loop's first-occurrence tie-breaking.
+    """
+    bar_counts = np.searchsorted(ts, cutoffs, side='right').astype(np.int64)
+    n_cutoffs = cutoffs.shape[0]
+    n_bars = int(bar_counts.max()) if n_cutoffs else 0
+    if n_bars == 0:
+        missing = np.full(n_cutoffs, -1, dtype=np.int64)
+        return bar_counts, missing, missing.copy(), missing.copy()
+
+    low = low[:n_bars]
+    high = high[:n_bars]
+    positions = np.arange(n_bars, dtype=np.int64)
+
+    # Index of the running minimum LOW / maximum HIGH for every prefix
+    new_low = np.empty(n_bars, dtype=bool)
+    new_low[0] = True
+    new_low[1:] = low[1:] < np.minimum.accumulate(low)[:-1]
+    running_drawdown_idx = np.maximum.accumulate(np.where(new_low, positions, 0))
+
+    new_high = np.empty(n_bars, dtype=bool)
+    new_high[0] = True
+    new_high[1:] = high[1:] > np.maximum.accumulate(high)[:-1]
+    running_mfe_idx = np.maximum.accumulate(np.where(new_high, positions, 0))
+
+    # First bar strictly after each index with HIGH >= entry (n_bars if none)
+    hits = np.where(high >= entry, positions, n_bars)
+    next_hit = np.append(np.minimum.accumulate(hits[::-1])[::-1][1:], n_bars)
+
+    has_bars = bar_counts > 0
+    last_idx = np.maximum(bar_counts - 1, 0)
+    drawdown_idxs = np.where(has_bars, running_drawdown_idx[last_idx], -1)
+    mfe_idxs = np.where(has_bars, running_mfe_idx[last_idx], -1)
+    recovery = next_hit[np.maximum(drawdown_idxs, 0)]
+    recovery_idxs = np.where(has_bars & (recovery < bar_counts), recovery, -1)
+
+    return bar_counts, drawdown_idxs, mfe_idxs, recovery_idxs
+
+
+# A compiled loop beats NumPy's several passes; without Numba the
+# interpreted loop would not, so fall back to the vectorized version
+if NUMBA_AVAILABLE:
+    _scan_prefixes = njit(cache=True)(_scan_prefixes_loop)
+else:
+    _scan_prefixes = _scan_prefixes_numpy
+
+
+@lru_cache(maxsize=32)
+def _cutoff_plan(timeframes: Tuple[int, ...]) -> Tuple[Tuple[int, ...], np.ndarray]:
+    """Precompute the scan order and cutoff offsets for a timeframe tuple.
+
+    The timeframes are fixed for a whole batch, so sorting them and scaling
+    to nanoseconds is done once per distinct tuple rather than per trade.
+
+    Args:
+        timeframes: Timeframes in minutes, in caller order
+
+    Returns:
+        Tuple of (order, offsets_ns): caller indexes sorted by timeframe, and
+        the matching window lengths in nanoseconds (read-only)
+    """
+    order = tuple(sorted(range(len(timeframes)), key=lambda i: timeframes[i]))
+    offsets_ns = np.array(
+        [timeframes[i] * _NS_PER_MINUTE for i in order],
+        dtype=np.int64
+    )
+    offsets_ns.flags.writeable = False
+    return order, offsets_ns
 
 
 class DrawdownCalculator:
@@ -92,23 +253,87 @@ class DrawdownCalculator:
               max_favorable_excursion_pct = 2.0
               recovery_time_seconds = 240
         """
-        # Ensure entry_time is timezone-aware
-        if entry_time.tzinfo is None:
-            entry_time = UTC_TZ.localize(entry_time)
+        ts_ns, lows, highs, closes = self._bars_to_soa(bars)
+
+        return self.calculate_all_timeframes_arr(
+            ts_ns,
+            lows,
+            highs,
+            closes,
+            entry_price,
+            entry_time,
+            timeframes=[timeframe_minutes],
+            position_size=position_size
+        )[0]
+
+    def _bars_to_soa(
+        self,
+        bars: List[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Convert bar dictionaries into chronologically sorted parallel arrays.
+
+        Doing this once per trade replaces repeated dict lookups per bar and
+        per timeframe with contiguous arrays the scans can vectorize over.
+
+        Args:
+            bars: List of OHLCV bar dictionaries with 'timestamp', 'high', 'low', 'close'
+
+        Returns:
+            Tuple of (timestamps as int64 epoch nanoseconds, low, high, close),
+            all float64 except the timestamps, sorted by timestamp
+
+        Example:
+            >>> ts_ns, lows, highs, closes = calculator._bars_to_soa(bars)
+            >>> results = calculator.calculate_all_timeframes_arr(
+            ...     ts_ns, lows, highs, closes, 150.25, entry_time
+            ... )
+        """
+        count = len(bars)
+        ts_ns = np.fromiter((_to_ns(bar['timestamp']) for bar in bars), dtype=np.int64, count=count)
+        lows = np.fromiter((bar['low'] for bar in bars), dtype=np.float64, count=count)
+        highs = np.fromiter((bar['high'] for bar in bars), dtype=np.float64, count=count)
+        closes = np.fromiter((bar['close'] for bar in bars), dtype=np.float64, count=count)
 
-        # Calculate timeframe cutoff
-        cutoff_time = entry_time + timedelta(minutes=timeframe_minutes)
+        # Stable sort keeps the input order of bars sharing a timestamp
+        order = np.argsort(ts_ns, kind='stable')
+        return ts_ns[order], lows[order], highs[order], closes[order]
 
-        # Filter bars within timeframe window
-        # Include bars from entry_time up to cutoff_time
-        relevant_bars = [
-            bar for bar in bars
-            if entry_time <= bar['timestamp'] <= cutoff_time
-        ]
+    def _window_metrics(
+        self,
+        ts_ns: np.ndarray,
+        lows: np.ndarray,
+        highs: np.ndarray,
+        closes: np.ndarray,
+        offsets_s: np.ndarray,
+        entry_price: float,
+        timeframe_minutes: int,
+        position_size: int,
+        bar_count: int,
+        drawdown_idx: int,
+        mfe_idx: int,
+        recovery_idx: int
+    ) -> Dict[str, Any]:
+        """Build the metrics dictionary for one timeframe from its scan snapshot.
 
-        # Sort by timestamp to ensure chronological order
-        relevant_bars.sort(key=lambda b: b['timestamp'])
+        Args:
+            ts_ns: Sorted bar timestamps (epoch nanoseconds), starting at the
+                first bar at or after entry
+            lows: LOW prices aligned with ``ts_ns``
+            highs: HIGH prices aligned with ``ts_ns``
+            closes: CLOSE prices aligned with ``ts_ns``
+            offsets_s: Whole seconds from entry for each bar in the
+                longest window
+            entry_price: Entry price for the trade
+            timeframe_minutes: Analysis window in minutes
+            position_size: Number of shares (for dollar calculations)
+            bar_count: Number of bars in the window
+            drawdown_idx: Index of the lowest LOW in the window
+            mfe_idx: Index of the highest HIGH in the window
+            recovery_idx: Index of the recovery bar, or -1
 
+        Returns:
+            Metrics dictionary (see calculate_for_timeframe)
+        """
         # Initialize metrics
         metrics = {
             'timeframe_minutes': timeframe_minutes,
@@ -123,71 +348,47 @@ class DrawdownCalculator:
             'recovery_time_seconds': None,
             'end_of_timeframe_pnl_pct': 0.0,
             'end_of_timeframe_pnl_dollar': 0.0,
-            'bar_count': len(relevant_bars)
+            'bar_count': bar_count
         }
 
-        if not relevant_bars:
+        if not bar_count:
             # No bars in timeframe - return zeros
             return metrics
 
-        # Track maximum drawdown and favorable excursion
-        max_drawdown_pct = 0.0
-        max_mfe_pct = 0.0
-        drawdown_bar = None
-        mfe_bar = None
-        had_drawdown = False
-
-        for bar in relevant_bars:
-            # Calculate P&L using LOW for potential drawdown
-            low_pnl_pct = self._calculate_pnl_pct(bar['low'], entry_price)
-
-            # Calculate P&L using HIGH for potential favorable excursion
-            high_pnl_pct = self._calculate_pnl_pct(bar['high'], entry_price)
-
-            # Track maximum drawdown (most negative)
-            if low_pnl_pct < max_drawdown_pct:
-                max_drawdown_pct = low_pnl_pct
-                drawdown_bar = bar
-                had_drawdown = True
-
-            # Track maximum favorable excursion (most positive)
-            if high_pnl_pct > max_mfe_pct:
-                max_mfe_pct = high_pnl_pct
-                mfe_bar = bar
-
-        # Populate drawdown metrics
-        if drawdown_bar:
+        # Hot path inlines _calculate_pnl_pct: the zero-entry branch and the
+        # division are hoisted into one reciprocal
+        inv_entry_pct = (100.0 / entry_price) if entry_price else 0.0
+        dollars_per_pct = entry_price * position_size / 100
+
+        # LOW gives the potential drawdown, HIGH the favorable excursion
+        min_low = lows[drawdown_idx]
+        max_high = highs[mfe_idx]
+        max_drawdown_pct = float((min_low - entry_price) * inv_entry_pct)
+        max_mfe_pct = float((max_high - entry_price) * inv_entry_pct)
+
+        # Only a strictly negative/positive move counts as a drawdown/excursion
+        if max_drawdown_pct < 0:
             metrics['max_drawdown_pct'] = max_drawdown_pct
-            metrics['max_drawdown_dollar'] = max_drawdown_pct / 100 * entry_price * position_size
-            metrics['time_to_max_drawdown_seconds'] = int(
-                (drawdown_bar['timestamp'] - entry_time).total_seconds()
-            )
-            metrics['price_at_max_drawdown'] = drawdown_bar['low']
+            metrics['max_drawdown_dollar'] = max_drawdown_pct * dollars_per_pct
+            metrics['time_to_max_drawdown_seconds'] = int(offsets_s[drawdown_idx])
+            metrics['price_at_max_drawdown'] = float(min_low)
+
+            # Recovery: first bar after the drawdown with HIGH >= entry
+            if recovery_idx >= 0:
+                metrics['recovery_time_seconds'] = int(
+                    (ts_ns[recovery_idx] - ts_ns[drawdown_idx]) // _NS_PER_SECOND
+                )
 
-        # Populate favorable excursion metrics
-        if mfe_bar:
+        if max_mfe_pct > 0:
             metrics['max_favorable_excursion_pct'] = max_mfe_pct
-            metrics['max_favorable_excursion_dollar'] = max_mfe_pct / 100 * entry_price * position_size
-            metrics['time_to_max_favorable_excursion_seconds'] = int(
-                (mfe_bar['timestamp'] - entry_time).total_seconds()
-            )
-            metrics['price_at_max_favorable_excursion'] = mfe_bar['high']
-
-        # Find recovery time if there was a drawdown
-        if had_drawdown and drawdown_bar:
-            recovery_time = self._find_recovery_time(
-                relevant_bars,
-                entry_price,
-                drawdown_bar['timestamp']
-            )
-            if recovery_time is not None:
-                metrics['recovery_time_seconds'] = recovery_time
+            metrics['max_favorable_excursion_dollar'] = max_mfe_pct * dollars_per_pct
+            metrics['time_to_max_favorable_excursion_seconds'] = int(offsets_s[mfe_idx])
+            metrics['price_at_max_favorable_excursion'] = float(max_high)
 
         # Calculate P&L at end of timeframe (or last available bar)
-        last_bar = relevant_bars[-1]
-        end_pnl_pct = self._calculate_pnl_pct(last_bar['close'], entry_price)
+        end_pnl_pct = float((closes[bar_count - 1] - entry_price) * inv_entry_pct)
         metrics['end_of_timeframe_pnl_pct'] = end_pnl_pct
-        metrics['end_of_timeframe_pnl_dollar'] = end_pnl_pct / 100 * entry_price * position_size
+        metrics['end_of_timeframe_pnl_dollar'] = end_pnl_pct * dollars_per_pct
 
         return metrics
 
@@ -212,47 +413,6 @@ class DrawdownCalculator:
             return 0.0
         return ((current_price - entry_price) / entry_price) * 100
 
-    def _find_recovery_time(
-        self,
-        bars: List[Dict[str, Any]],
-        entry_price: float,
-        drawdown_time: datetime
-    ) -> Optional[int]:
-        """Find time to recover from drawdown (return to breakeven).
-
-        Recovery is defined as the price reaching or exceeding the entry price
-        after the maximum drawdown occurred.
-
-        Args:
-            bars: List of bar dictionaries (chronologically sorted)
-            entry_price: Entry price (breakeven point)
-            drawdown_time: Timestamp when max drawdown occurred
-
-        Returns:
-            Seconds from entry to recovery, or None if never recovered
-
-        Example:
-            Drawdown at 9:32, recovery (price >= entry) at 9:34
-            Returns: 240 seconds (4 minutes from 9:30 entry)
-        """
-        # Find bars after drawdown time
-        post_drawdown_bars = [
-            bar for bar in bars
-            if bar['timestamp'] > drawdown_time
-        ]
-
-        # Look for first bar where high >= entry_price (breakeven or better)
-        for bar in post_drawdown_bars:
-            if bar['high'] >= entry_price:
-                # Calculate seconds from drawdown to recovery
-                recovery_seconds = int(
-                    (bar['timestamp'] - drawdown_time).total_seconds()
-                )
-                return recovery_seconds
-
-        # Never recovered within timeframe
-        return None
-
     def validate_results(self, results: Dict[str, Any]) -> List[str]:
         """Sanity check results for logical consistency.
 
@@ -359,17 +519,91 @@ class DrawdownCalculator:
             >>> for metrics in all_metrics:
             ...     print(f"{metrics['timeframe_minutes']}min: {metrics['max_drawdown_pct']:.2f}%")
         """
-        results = []
-
-        for timeframe in timeframes:
-            metrics = self.calculate_for_timeframe(
-                bars=bars,
-                entry_price=entry_price,
-                entry_time=entry_time,
-                timeframe_minutes=timeframe,
-                position_size=position_size
+        ts_ns, lows, highs, closes = self._bars_to_soa(bars)
+
+        return self.calculate_all_timeframes_arr(
+            ts_ns,
+            lows,
+            highs,
+            closes,
+            entry_price,
+            entry_time,
+            timeframes=timeframes,
+            position_size=position_size
+        )
+
+    def calculate_all_timeframes_arr(
+        self,
+        ts_ns: np.ndarray,
+        lows: np.ndarray,
+        highs: np.ndarray,
+        closes: np.ndarray,
+        entry_price: float,
+        entry_time: datetime,
+        timeframes: List[int] = [3, 5, 10, 15, 30, 60, 120, 240],
+        position_size: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Calculate metrics for all timeframes from pre-converted bar arrays.
+
+        Array counterpart of calculate_all_timeframes for callers that convert
+        bars once with _bars_to_soa and reuse the arrays.
+
+        Args:
+            ts_ns: Sorted bar timestamps in epoch nanoseconds
+            lows: LOW prices aligned with ``ts_ns``
+            highs: HIGH prices aligned with ``ts_ns``
+            closes: CLOSE prices aligned with ``ts_ns``
+            entry_price: Entry price
+            entry_time: Entry timestamp
+            timeframes: List of timeframes in minutes (default: standard 8)
+            position_size: Number of shares
+
+        Returns:
+            List of metrics dictionaries, one per timeframe
+        """
+        # Ensure entry_time is timezone-aware
+        if entry_time.tzinfo is None:
+            entry_time = entry_time.replace(tzinfo=UTC_TZ)
+
+        # Every window starts at the first bar at or after entry
+        entry_ns = _to_ns(entry_time)
+        start_idx = int(np.searchsorted(ts_ns, entry_ns, side='left'))
+
+        ts_ns = ts_ns[start_idx:]
+        lows = lows[start_idx:]
+        highs = highs[start_idx:]
+        closes = closes[start_idx:]
+
+        # Windows are nested prefixes, so one pass over the bars in cutoff
+        # order snapshots every timeframe
+        order, offsets_ns = _cutoff_plan(tuple(timeframes))
+        cutoffs = offsets_ns + np.int64(entry_ns)
+        bar_counts, drawdown_idxs, mfe_idxs, recovery_idxs = _scan_prefixes(
+            lows, highs, ts_ns, float(entry_price), cutoffs
+        )
+
+        # Seconds from entry for every bar any window can reach, computed once
+        # as one integer vector op instead of per metric and timeframe
+        max_bars = int(bar_counts.max()) if len(bar_counts) else 0
+        offsets_s = (ts_ns[:max_bars] - entry_ns) // _NS_PER_SECOND
+
+        results = [None] * len(timeframes)
+
+        for snapshot, i in enumerate(order):
+            results[i] = self._window_metrics(
+                ts_ns,
+                lows,
+                highs,
+                closes,
+                offsets_s,
+                entry_price,
+                timeframes[i],
+                position_size,
+                int(bar_counts[snapshot]),
+                int(drawdown_idxs[snapshot]),
+                int(mfe_idxs[snapshot]),
+                int(recovery_idxs[snapshot])
             )
-            results.append(metrics)
 
         return results
 
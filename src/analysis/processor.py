@@ -7,22 +7,43 @@ This module orchestrates the complete workflow:
 4. Handle errors and track progress
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from src.analysis.drawdown import DrawdownCalculator
 from src.polygon.fetcher import BarFetcher
+from src.polygon.cache import BarCache
 from src.polygon.client import PolygonAPIError
 from src.database.operations import (
     get_trade_by_id,
+    get_trade_rows_by_ids,
+    get_analysis_counts,
     bulk_insert_analysis,
     get_analysis_for_trade,
-    get_trades_without_analysis
+    get_trades_without_analysis,
+    IN_CLAUSE_CHUNK_SIZE
 )
 from src.database.models import Trade
 from src.utils.config import config
 
+# Trades stored between commits during batch analysis
+BATCH_COMMIT_INTERVAL = 100
+
+# Trade columns read by the bar fetcher and calculator; batch analysis
+# prefetches only these as plain rows instead of full Trade objects
+ANALYSIS_COLUMNS = (
+    Trade.trade_id,
+    Trade.symbol,
+    Trade.entry_timestamp,
+    Trade.exit_timestamp,
+    Trade.entry_price,
+    Trade.max_size
+)
+
 
 class TradeAnalyzer:
     """Orchestrate analysis for trades across all timeframes.
@@ -35,6 +56,7 @@ class TradeAnalyzer:
         bar_fetcher: BarFetcher instance for market data
         calculator: DrawdownCalculator for metric calculations
         timeframes: List of timeframes to analyze (minutes)
+        max_concurrent: Maximum bar fetches in flight during batch analysis
 
     Example:
         >>> with get_session() as session:
@@ -48,20 +70,30 @@ class TradeAnalyzer:
         session: Session,
         bar_fetcher: Optional[BarFetcher] = None,
         calculator: Optional[DrawdownCalculator] = None,
-        timeframes: Optional[List[int]] = None
+        timeframes: Optional[List[int]] = None,
+        max_concurrent: Optional[int] = None
     ):
         """Initialize trade analyzer.
 
         Args:
             session: Active SQLAlchemy session
-            bar_fetcher: BarFetcher instance (creates new if None)
+            bar_fetcher: BarFetcher instance (creates a disk-cached one if None)
             calculator: DrawdownCalculator instance (creates new if None)
             timeframes: List of timeframes in minutes (uses config if None)
+            max_concurrent: Bar fetches in flight during batch analysis
+                (uses config if None; 1 = sequential)
         """
         self.session = session
-        self.bar_fetcher = bar_fetcher or BarFetcher()
+        self.bar_fetcher = bar_fetcher or BarFetcher(
+            cache=BarCache(
+                ttl_hours=config.polygon_data_settings.get('cache_ttl', {}).get('minute', 24)
+            )
+        )
         self.calculator = calculator or DrawdownCalculator()
         self.timeframes = timeframes or config.timeframes
+        self.max_concurrent = max_concurrent or config.polygon_data_settings.get(
+            'max_concurrent_requests', 4
+        )
 
     def analyze_trade(
         self,
@@ -105,39 +137,35 @@ class TradeAnalyzer:
             ... else:
             ...     print(f"❌ Error: {result['error']}")
         """
-        result = {
-            'trade_id': trade_id,
-            'symbol': None,
-            'success': False,
-            'timeframes_completed': 0,
-            'bars_fetched': 0,
-            'warnings': [],
-            'error': None
-        }
+        return self._analyze_one(trade_id, granularity, force_refresh)
 
-        try:
-            # 1. Fetch trade from database
-            trade = get_trade_by_id(self.session, trade_id)
-            if not trade:
-                raise ValueError(f"Trade {trade_id} not found")
-
-            result['symbol'] = trade.symbol
-
-            # 2. Check if analysis already exists
-            if not force_refresh:
-                existing_analysis = get_analysis_for_trade(self.session, trade_id)
-                if existing_analysis:
-                    result['warnings'].append(
-                        f"Analysis already exists ({len(existing_analysis)} timeframes). "
-                        f"Use force_refresh=True to recalculate."
-                    )
-                    result['success'] = True
-                    result['timeframes_completed'] = len(existing_analysis)
-                    return result
+    def _analyze_one(
+        self,
+        trade_id: int,
+        granularity: str,
+        force_refresh: bool,
+        prefetch: Optional[Tuple[Dict[int, Any], Dict[int, int]]] = None,
+        autocommit: bool = True
+    ) -> Dict[str, Any]:
+        """Run the analyze_trade() workflow, optionally from prefetched rows.
 
-            # Delete existing analysis if force refresh
-            if force_refresh:
-                self._delete_existing_analysis(trade_id)
+        Args:
+            trade_id: ID of trade to analyze
+            granularity: Data granularity ('minute', 'second', 'tick')
+            force_refresh: If True, delete existing analysis and recalculate
+            prefetch: Optional (trades_by_id, analysis_counts) loaded for a batch
+            autocommit: Commit after storing; if False the caller commits
+
+        Returns:
+            Analysis summary dictionary (see analyze_trade())
+        """
+        result = self._new_result(trade_id)
+
+        try:
+            # 1-2. Fetch trade and check for existing analysis
+            trade = self._prepare_trade(trade_id, result, force_refresh, prefetch)
+            if trade is None:
+                return result
 
             # 3. Fetch market data
             try:
@@ -145,58 +173,19 @@ class TradeAnalyzer:
                     trade,
                     granularity=granularity
                 )
-                result['bars_fetched'] = len(bars)
-
-                if not bars:
-                    result['error'] = "No market data available"
-                    result['warnings'].append(
-                        "This could be due to: free tier limitations, recent date, "
-                        "market closed, or invalid symbol"
-                    )
-                    return result
-
             except PolygonAPIError as e:
                 result['error'] = f"API error: {str(e)}"
                 return result
 
-            # 4. Calculate metrics for all timeframes
-
-            analysis_records = []
-
-            for timeframe in self.timeframes:
-                # Calculate metrics
-                metrics = self.calculator.calculate_for_timeframe(
-                    bars=bars,
-                    entry_price=trade.entry_price,
-                    entry_time=datetime.fromisoformat(trade.entry_timestamp),
-                    timeframe_minutes=timeframe,
-                    position_size=trade.max_size
-                )
-
-                # Validate results
-                validation_warnings = self.calculator.validate_results(metrics)
-                if validation_warnings:
-                    result['warnings'].extend([
-                        f"{timeframe}min: {w}" for w in validation_warnings
-                    ])
-
-                # Prepare record for database
-                analysis_record = {
-                    'trade_id': trade_id,
-                    **metrics
-                }
-                analysis_records.append(analysis_record)
-
-            # 5. Insert into database
-            inserted_count = bulk_insert_analysis(self.session, analysis_records)
-            self.session.commit()
-
-            result['success'] = True
-            result['timeframes_completed'] = inserted_count
+            # 4-5. Calculate, validate and store metrics
+            self._store_analysis(trade, bars, result, force_refresh, autocommit)
 
         except Exception as e:
             result['error'] = str(e)
-            self.session.rollback()
+            # Without autocommit the failed insert was already undone by its
+            # savepoint; a full rollback would discard uncommitted trades
+            if autocommit:
+                self.session.rollback()
 
         return result
 
@@ -209,6 +198,14 @@ class TradeAnalyzer:
     ) -> Dict[str, Any]:
         """Analyze multiple trades with progress tracking.
 
+        When ``max_concurrent`` > 1, bar fetches for the batch run in a
+        bounded thread pool while results are stored in trade order.
+        Results are committed every BATCH_COMMIT_INTERVAL trades rather than
+        per trade; each trade's insert runs in a savepoint so a failure only
+        discards that trade. With ``force_refresh``, a trade's old analysis
+        is deleted in the same savepoint, so trades that fail or are never
+        reached keep their existing records.
+
         Args:
             trade_ids: List of trade IDs to analyze
             granularity: Data granularity for all trades
@@ -238,34 +235,161 @@ class TradeAnalyzer:
             'failures': []
         }
 
-        for i, trade_id in enumerate(trade_ids, 1):
-            result = self.analyze_trade(
-                trade_id=trade_id,
-                granularity=granularity,
-                force_refresh=force_refresh
+        # Load every trade and its existing-analysis count up front
+        # instead of two lookups per trade. Trades come back as plain
+        # read-only rows, so commits never expire them and worker threads
+        # can read them without touching the session.
+        prefetch = (
+            get_trade_rows_by_ids(self.session, trade_ids, ANALYSIS_COLUMNS),
+            {} if force_refresh else get_analysis_counts(self.session, trade_ids)
+        )
+
+        if self.max_concurrent > 1 and len(trade_ids) > 1:
+            results = self._analyze_concurrently(
+                trade_ids, granularity, force_refresh, prefetch
+            )
+        else:
+            results = self._analyze_sequentially(
+                trade_ids, granularity, force_refresh, prefetch
             )
 
+        for i, result in enumerate(results, 1):
+            if i % BATCH_COMMIT_INTERVAL == 0:
+                self.session.commit()
+
             if result['success']:
                 summary['successful'] += 1
                 summary['total_timeframes'] += result['timeframes_completed']
             else:
                 summary['failed'] += 1
                 summary['failures'].append({
-                    'trade_id': trade_id,
+                    'trade_id': result['trade_id'],
                     'symbol': result['symbol'],
                     'error': result['error']
                 })
 
                 if stop_on_error:
+                    # Close now so queued fetches are cancelled, not run
+                    results.close()
                     break
 
-            # Brief pause to respect rate limits
-            if i < len(trade_ids):
-                import time
-                time.sleep(0.5)
+        self.session.commit()
 
         return summary
 
+    def _analyze_sequentially(
+        self,
+        trade_ids: List[int],
+        granularity: str,
+        force_refresh: bool,
+        prefetch: Tuple[Dict[int, Any], Dict[int, int]]
+    ):
+        """Yield analysis results one trade at a time.
+
+        There is no fixed pause between trades: the Polygon client's rate
+        limiter sleeps only when the call budget is exhausted, and cached
+        bars need no pacing at all.
+
+        Args:
+            trade_ids: Trade IDs to analyze, in order
+            granularity: Data granularity for all trades
+            force_refresh: Replace each trade's existing analysis when its
+                new results are stored
+            prefetch: (trades_by_id, analysis_counts) loaded for the batch
+
+        Yields:
+            Result dictionary from analyze_trade() for each trade
+        """
+        for trade_id in trade_ids:
+            yield self._analyze_one(
+                trade_id, granularity, force_refresh, prefetch, autocommit=False
+            )
+
+    def _analyze_concurrently(
+        self,
+        trade_ids: List[int],
+        granularity: str,
+        force_refresh: bool,
+        prefetch: Tuple[Dict[int, Any], Dict[int, int]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Overlap bar fetches across trades while keeping DB work serial.
+
+        Market data requests are network-bound, so they are dispatched to a
+        thread pool capped at ``max_concurrent``; pacing is left to the
+        client's rate limiter. The session is not thread-safe, so database
+        reads, calculations and commits all stay on the calling thread, and
+        workers only see the detached trade copies from _prepare_trade().
+
+        At most ``2 * max_concurrent`` fetches are queued at a time, and
+        each one is released once its trade is stored, so memory is bounded
+        by the window rather than by the total bars in the batch. Closing
+        the generator early cancels every fetch that has not started yet.
+
+        Args:
+            trade_ids: Trade IDs to analyze, in order
+            granularity: Data granularity for all trades
+            force_refresh: Replace each trade's existing analysis when its
+                new results are stored
+            prefetch: (trades_by_id, analysis_counts) loaded for the batch
+
+        Yields:
+            Result dictionaries in the same order as trade_ids
+        """
+        window = 2 * self.max_concurrent
+        queued_ids = iter(trade_ids)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as pool:
+            def top_up():
+                for trade_id in islice(queued_ids, window - len(pending)):
+                    result = self._new_result(trade_id)
+                    trade = None
+                    future = None
+
+                    try:
+                        trade = self._prepare_trade(
+                            trade_id, result, force_refresh, prefetch
+                        )
+                        if trade is not None:
+                            future = pool.submit(
+                                self.bar_fetcher.fetch_bars_for_trade,
+                                trade,
+                                granularity=granularity
+                            )
+                    except Exception as e:
+                        result['error'] = str(e)
+
+                    pending.append((result, trade, future))
+
+            top_up()
+
+            try:
+                # Consume fetches in order, queueing the next one before waiting
+                while pending:
+                    result, trade, future = pending.popleft()
+                    top_up()
+
+                    if future is not None:
+                        try:
+                            bars = future.result()
+                            self._store_analysis(
+                                trade, bars, result, force_refresh, autocommit=False
+                            )
+                        except PolygonAPIError as e:
+                            result['error'] = f"API error: {str(e)}"
+                        except Exception as e:
+                            result['error'] = str(e)
+                        finally:
+                            bars = future = None
+
+                    yield result
+            finally:
+                # Stopped early (caller closed us or raised): cancel queued
+                # fetches so the pool's shutdown only waits on running ones
+                for _, _, remaining in pending:
+                    if remaining is not None:
+                        remaining.cancel()
+
     def reanalyze_trade(self, trade_id: int, granularity: str = 'minute') -> Dict[str, Any]:
         """Delete existing analysis and recalculate.
 
@@ -332,8 +456,8 @@ class TradeAnalyzer:
             >>> # Analyze only first 10 unprocessed
             >>> result = analyzer.analyze_all_unprocessed(limit=10)
         """
-        # Get trades without analysis
-        unprocessed_trades = get_trades_without_analysis(self.session)
+        # Get trades without analysis (limit applied in SQL)
+        unprocessed_trades = get_trades_without_analysis(self.session, limit=limit)
 
         if not unprocessed_trades:
             return {
@@ -344,28 +468,176 @@ class TradeAnalyzer:
                 'failures': []
             }
 
-        # Apply limit if specified
-        if limit:
-            unprocessed_trades = unprocessed_trades[:limit]
-
         # Extract trade IDs
         trade_ids = [trade.trade_id for trade in unprocessed_trades]
 
         # Analyze batch
         return self.analyze_batch(trade_ids, granularity=granularity)
 
-    def _delete_existing_analysis(self, trade_id: int):
-        """Delete existing analysis records for a trade.
+    def _new_result(self, trade_id: int) -> Dict[str, Any]:
+        """Create an empty analysis result for a trade.
+
+        Args:
+            trade_id: Trade ID the result describes
+
+        Returns:
+            Result dictionary in the shape returned by analyze_trade()
+        """
+        return {
+            'trade_id': trade_id,
+            'symbol': None,
+            'success': False,
+            'timeframes_completed': 0,
+            'bars_fetched': 0,
+            'warnings': [],
+            'error': None
+        }
+
+    def _prepare_trade(
+        self,
+        trade_id: int,
+        result: Dict[str, Any],
+        force_refresh: bool,
+        prefetch: Optional[Tuple[Dict[int, Any], Dict[int, int]]] = None
+    ) -> Optional[Any]:
+        """Load a trade and decide whether it needs (re)analysis.
+
+        Args:
+            trade_id: ID of trade to analyze
+            result: Result dictionary to update
+            force_refresh: If True, skip the existing-analysis check
+            prefetch: Optional (trade_rows_by_id, analysis_counts) to look up
+                instead of querying
+
+        Returns:
+            Detached copy or prefetched row of the trade to analyze (safe to
+            read after commits and from worker threads), or None if existing
+            analysis was kept (result is then already marked successful)
+
+        Raises:
+            ValueError: If trade not found
+        """
+        if prefetch is None:
+            trade = get_trade_by_id(self.session, trade_id)
+        else:
+            trade = prefetch[0].get(trade_id)
+        if not trade:
+            raise ValueError(f"Trade {trade_id} not found")
+
+        result['symbol'] = trade.symbol
+
+        # Check if analysis already exists
+        if not force_refresh:
+            if prefetch is None:
+                existing_count = len(get_analysis_for_trade(self.session, trade_id))
+            else:
+                existing_count = prefetch[1].get(trade_id, 0)
+            if existing_count:
+                result['warnings'].append(
+                    f"Analysis already exists ({existing_count} timeframes). "
+                    f"Use force_refresh=True to recalculate."
+                )
+                result['success'] = True
+                result['timeframes_completed'] = existing_count
+                return None
+
+        if prefetch is not None:
+            return trade  # Prefetched rows are already immutable snapshots
+        return Trade(**trade.to_dict())
+
+    def _store_analysis(
+        self,
+        trade: Trade,
+        bars: List[Dict[str, Any]],
+        result: Dict[str, Any],
+        force_refresh: bool = False,
+        autocommit: bool = True
+    ):
+        """Calculate, validate and insert metrics for fetched bars.
+
+        Writes run inside a savepoint, so a failed insert is rolled back
+        without touching other uncommitted trades in the same transaction.
+
+        Args:
+            trade: Trade the bars belong to
+            bars: Bars returned by the bar fetcher
+            result: Result dictionary to update
+            force_refresh: If True, replace existing analysis records
+            autocommit: Commit after inserting; if False the caller commits
+        """
+        result['bars_fetched'] = len(bars)
+
+        if not bars:
+            result['error'] = "No market data available"
+            result['warnings'].append(
+                "This could be due to: free tier limitations, recent date, "
+                "market closed, or invalid symbol"
+            )
+            return
+
+        # Convert bars to parallel arrays once and reuse them for every window
+        ts_ns, lows, highs, closes = self.calculator._bars_to_soa(bars)
+        all_metrics = self.calculator.calculate_all_timeframes_arr(
+            ts_ns,
+            lows,
+            highs,
+            closes,
+            entry_price=trade.entry_price,
+            entry_time=datetime.fromisoformat(trade.entry_timestamp),
+            timeframes=self.timeframes,
+            position_size=trade.max_size
+        )
+
+        analysis_records = []
+
+        for metrics in all_metrics:
+            timeframe = metrics['timeframe_minutes']
+
+            # Validate results
+            validation_warnings = self.calculator.validate_results(metrics)
+            if validation_warnings:
+                result['warnings'].extend([
+                    f"{timeframe}min: {w}" for w in validation_warnings
+                ])
+
+            # Prepare record for database
+            analysis_record = {
+                'trade_id': trade.trade_id,
+                **metrics
+            }
+            analysis_records.append(analysis_record)
+
+        with self.session.begin_nested():
+            # Delete existing analysis if force refresh
+            if force_refresh:
+                self._delete_existing_analyses([trade.trade_id])
+
+            # Insert into database
+            inserted_count = bulk_insert_analysis(self.session, analysis_records)
+
+        if autocommit:
+            self.session.commit()
+
+        result['success'] = True
+        result['timeframes_completed'] = inserted_count
+
+    def _delete_existing_analyses(self, trade_ids: List[int]):
+        """Delete existing analysis records for one or more trades.
+
+        Issues one DELETE per IN_CLAUSE_CHUNK_SIZE IDs. The bulk delete runs
+        immediately, so no flush is needed.
 
         Args:
-            trade_id: Trade ID to delete analysis for
+            trade_ids: Trade IDs to delete analysis for
         """
         from src.database.models import DrawdownAnalysis
 
-        self.session.query(DrawdownAnalysis).filter(
-            DrawdownAnalysis.trade_id == trade_id
-        ).delete()
-        self.session.flush()
+        unique_ids = list(dict.fromkeys(trade_ids))
+        for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = unique_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            self.session.query(DrawdownAnalysis).filter(
+                DrawdownAnalysis.trade_id.in_(chunk)
+            ).delete(synchronize_session=False)
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -5,13 +5,16 @@ Usage:
     python -m src.cli.import_trades data/my_trades.csv
     python -m src.cli.import_trades data/my_trades.csv --dry-run
     python -m src.cli.import_trades data/my_trades.csv --delimiter "|"
+    python -m src.cli.import_trades data/my_trades.csv --batch-size 5000
 """
 
 import sys
 import argparse
 from pathlib import Path
 
-from src.utils.csv_processor import import_trades_from_csv, validate_csv_file
+from src.utils.csv_processor import (
+    import_trades_from_csv, validate_csv_file, DEFAULT_IMPORT_BATCH_SIZE
+)
 
 
 def main():
@@ -33,6 +36,9 @@ Examples:
   # Validate file format first
   python -m src.cli.import_trades trades.csv --validate-only
 
+  # Larger batches for very big files
+  python -m src.cli.import_trades trades.csv --batch-size 5000
+
 CSV Format:
   Expected columns (pipe-separated by default):
     Symbol | Start | End | Net P&L | Gross P&L | Max Size |
@@ -60,6 +66,13 @@ CSV Format:
         help='Column delimiter (default: | from config)'
     )
 
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_IMPORT_BATCH_SIZE,
+        help=f'Rows per duplicate check and INSERT (default: {DEFAULT_IMPORT_BATCH_SIZE})'
+    )
+
     parser.add_argument(
         '--validate-only',
         action='store_true',
@@ -98,7 +111,8 @@ CSV Format:
             args.csv_file,
             skip_header=True,
             dry_run=args.dry_run,
-            delimiter=args.delimiter
+            delimiter=args.delimiter,
+            batch_size=args.batch_size
         )
 
         # Print summary
@@ -1,14 +1,196 @@
 """Database initialization and schema creation."""
 
 from pathlib import Path
-from sqlalchemy import inspect
+from typing import Optional, Sequence, Dict, Any
+from sqlalchemy import inspect, select, func
 
 from src.database.models import Base
 from src.database.session import engine, get_session
-from src.database.operations import create_trade
+from src.database.operations import bulk_create_trades
 from src.utils.config import config
 
 
+# Demonstration trades inserted by create_sample_data(); built once at
+# import and kept as a tuple so repeated calls share it safely
+SAMPLE_TRADES = (
+    # Winning trades
+    {
+        'symbol': 'AAPL',
+        'strategy_type': 'news',
+        'entry_timestamp': '2024-01-15T09:31:00',
+        'exit_timestamp': '2024-01-15T10:15:00',
+        'entry_price': 150.25,
+        'exit_price': 152.50,
+        'price_at_max_size': 150.50,
+        'avg_price_at_max': 150.40,
+        'max_size': 100,
+        'bp_used_at_max': 15040.00,
+        'net_pnl': 215.00,
+        'gross_pnl': 225.00,
+        'pnl_at_open': 50.00,
+        'pnl_at_close': 215.00,
+        'notes': 'Strong earnings beat, quick scalp'
+    },
+    {
+        'symbol': 'TSLA',
+        'strategy_type': 'breakout_breakdown',
+        'entry_timestamp': '2024-01-15T10:00:00',
+        'exit_timestamp': '2024-01-15T11:30:00',
+        'entry_price': 245.50,
+        'exit_price': 252.75,
+        'price_at_max_size': 246.00,
+        'avg_price_at_max': 245.80,
+        'max_size': 50,
+        'bp_used_at_max': 12290.00,
+        'net_pnl': 342.50,
+        'gross_pnl': 347.50,
+        'pnl_at_open': 100.00,
+        'pnl_at_close': 342.50,
+        'notes': 'Clean breakout above resistance'
+    },
+    {
+        'symbol': 'NVDA',
+        'strategy_type': 'orderflow',
+        'entry_timestamp': '2024-01-16T09:45:00',
+        'exit_timestamp': '2024-01-16T10:20:00',
+        'entry_price': 520.00,
+        'exit_price': 525.50,
+        'price_at_max_size': 521.00,
+        'avg_price_at_max': 520.50,
+        'max_size': 30,
+        'bp_used_at_max': 15615.00,
+        'net_pnl': 148.50,
+        'gross_pnl': 150.00,
+        'pnl_at_open': 75.00,
+        'pnl_at_close': 148.50,
+        'notes': 'Strong bid flow at support'
+    },
+    {
+        'symbol': 'AMD',
+        'strategy_type': 'secondary',
+        'entry_timestamp': '2024-01-16T14:00:00',
+        'exit_timestamp': '2024-01-16T15:30:00',
+        'entry_price': 155.25,
+        'exit_price': 157.80,
+        'price_at_max_size': 155.50,
+        'avg_price_at_max': 155.40,
+        'max_size': 75,
+        'bp_used_at_max': 11655.00,
+        'net_pnl': 178.50,
+        'gross_pnl': 180.00,
+        'pnl_at_open': None,
+        'pnl_at_close': 178.50,
+        'notes': 'Secondary offering complete, bounce'
+    },
+    {
+        'symbol': 'MSFT',
+        'strategy_type': 'swing',
+        'entry_timestamp': '2024-01-17T09:30:00',
+        'exit_timestamp': '2024-01-17T15:55:00',
+        'entry_price': 380.00,
+        'exit_price': 385.50,
+        'price_at_max_size': 381.00,
+        'avg_price_at_max': 380.50,
+        'max_size': 40,
+        'bp_used_at_max': 15220.00,
+        'net_pnl': 198.00,
+        'gross_pnl': 200.00,
+        'pnl_at_open': 20.00,
+        'pnl_at_close': 198.00,
+        'notes': 'Day swing on cloud announcement'
+    },
+
+    # Losing trades
+    {
+        'symbol': 'TSLA',
+        'strategy_type': 'news',
+        'entry_timestamp': '2024-01-18T09:35:00',
+        'exit_timestamp': '2024-01-18T10:05:00',
+        'entry_price': 248.00,
+        'exit_price': 245.50,
+        'price_at_max_size': 247.50,
+        'avg_price_at_max': 247.80,
+        'max_size': 60,
+        'bp_used_at_max': 14868.00,
+        'net_pnl': -137.80,
+        'gross_pnl': -138.00,
+        'pnl_at_open': -50.00,
+        'pnl_at_close': -137.80,
+        'notes': 'False breakout, stopped out'
+    },
+    {
+        'symbol': 'AAPL',
+        'strategy_type': 'orderflow_off_open',
+        'entry_timestamp': '2024-01-18T09:31:00',
+        'exit_timestamp': '2024-01-18T09:45:00',
+        'entry_price': 151.50,
+        'exit_price': 150.25,
+        'price_at_max_size': 151.25,
+        'avg_price_at_max': 151.40,
+        'max_size': 100,
+        'bp_used_at_max': 15140.00,
+        'net_pnl': -113.50,
+        'gross_pnl': -115.00,
+        'pnl_at_open': 0.00,
+        'pnl_at_close': -113.50,
+        'notes': 'Weak open, quick exit'
+    },
+    {
+        'symbol': 'META',
+        'strategy_type': 'curl',
+        'entry_timestamp': '2024-01-19T10:15:00',
+        'exit_timestamp': '2024-01-19T11:00:00',
+        'entry_price': 425.00,
+        'exit_price': 422.50,
+        'price_at_max_size': 424.50,
+        'avg_price_at_max': 424.80,
+        'max_size': 35,
+        'bp_used_at_max': 14868.00,
+        'net_pnl': -79.80,
+        'gross_pnl': -80.50,
+        'pnl_at_open': -25.00,
+        'pnl_at_close': -79.80,
+        'notes': 'Curl pattern failed, trend too strong'
+    },
+
+    # Breakeven/small trades
+    {
+        'symbol': 'GOOGL',
+        'strategy_type': 'earnings',
+        'entry_timestamp': '2024-01-19T16:05:00',
+        'exit_timestamp': '2024-01-19T16:15:00',
+        'entry_price': 145.50,
+        'exit_price': 145.65,
+        'price_at_max_size': 145.50,
+        'avg_price_at_max': 145.50,
+        'max_size': 80,
+        'bp_used_at_max': 11640.00,
+        'net_pnl': 10.50,
+        'gross_pnl': 12.00,
+        'pnl_at_open': None,
+        'pnl_at_close': 10.50,
+        'notes': 'After-hours earnings play, small gain'
+    },
+    {
+        'symbol': 'NFLX',
+        'strategy_type': 'roll',
+        'entry_timestamp': '2024-01-22T13:30:00',
+        'exit_timestamp': '2024-01-22T14:00:00',
+        'entry_price': 505.00,
+        'exit_price': 504.50,
+        'price_at_max_size': 505.25,
+        'avg_price_at_max': 505.10,
+        'max_size': 25,
+        'bp_used_at_max': 12627.50,
+        'net_pnl': -13.50,
+        'gross_pnl': -12.50,
+        'pnl_at_open': None,
+        'pnl_at_close': -13.50,
+        'notes': 'Choppy action, scratch trade'
+    },
+)
+
+
 def init_database(drop_existing: bool = False) -> None:
     """Initialize database schema.
 
@@ -28,12 +210,13 @@ def init_database(drop_existing: bool = False) -> None:
         print("✅ Tables dropped")
 
     print("Creating database tables...")
-    Base.metadata.create_all(engine)
+    # One table-list query instead of an existence check per table
+    existing = set(inspect(engine).get_table_names())
+    missing = [t for t in Base.metadata.sorted_tables if t.name not in existing]
+    Base.metadata.create_all(engine, tables=missing, checkfirst=False)
     print("✅ Database initialized successfully")
 
-    # Verify tables created
-    inspector = inspect(engine)
-    tables = inspector.get_table_names()
+    tables = sorted(existing | {table.name for table in missing})
     print(f"\n📊 Tables created: {', '.join(tables)}")
 
     # Show database location
@@ -43,205 +226,50 @@ def init_database(drop_existing: bool = False) -> None:
         print(f"📁 Database file: {db_path}\n")
 
 
-def create_sample_data() -> None:
+def create_sample_data(
+    trades: Optional[Sequence[Dict[str, Any]]] = None,
+    batch_size: Optional[int] = None
+) -> None:
     """Create sample trades for testing and demonstration.
 
-    Creates 10 sample trades with variety of:
+    By default creates the 10 SAMPLE_TRADES, with variety of:
     - Different symbols
     - Different strategies
     - Winning and losing trades
     - Different durations
 
+    Larger generated sets can be passed in; they are inserted in slices
+    of ``batch_size`` rows (one executemany INSERT each) within a single
+    transaction, so memory per statement stays bounded.
+
+    Args:
+        trades: Trade field dictionaries to insert (default: SAMPLE_TRADES)
+        batch_size: Rows per INSERT (uses config database.insert_batch_size
+            if None)
+
     Example:
         >>> create_sample_data()
         Created 10 sample trades
     """
-    sample_trades = [
-        # Winning trades
-        {
-            'symbol': 'AAPL',
-            'strategy_type': 'news',
-            'entry_timestamp': '2024-01-15T09:31:00',
-            'exit_timestamp': '2024-01-15T10:15:00',
-            'entry_price': 150.25,
-            'exit_price': 152.50,
-            'price_at_max_size': 150.50,
-            'avg_price_at_max': 150.40,
-            'max_size': 100,
-            'bp_used_at_max': 15040.00,
-            'net_pnl': 215.00,
-            'gross_pnl': 225.00,
-            'pnl_at_open': 50.00,
-            'pnl_at_close': 215.00,
-            'notes': 'Strong earnings beat, quick scalp'
-        },
-        {
-            'symbol': 'TSLA',
-            'strategy_type': 'breakout_breakdown',
-            'entry_timestamp': '2024-01-15T10:00:00',
-            'exit_timestamp': '2024-01-15T11:30:00',
-            'entry_price': 245.50,
-            'exit_price': 252.75,
-            'price_at_max_size': 246.00,
-            'avg_price_at_max': 245.80,
-            'max_size': 50,
-            'bp_used_at_max': 12290.00,
-            'net_pnl': 342.50,
-            'gross_pnl': 347.50,
-            'pnl_at_open': 100.00,
-            'pnl_at_close': 342.50,
-            'notes': 'Clean breakout above resistance'
-        },
-        {
-            'symbol': 'NVDA',
-            'strategy_type': 'orderflow',
-            'entry_timestamp': '2024-01-16T09:45:00',
-            'exit_timestamp': '2024-01-16T10:20:00',
-            'entry_price': 520.00,
-            'exit_price': 525.50,
-            'price_at_max_size': 521.00,
-            'avg_price_at_max': 520.50,
-            'max_size': 30,
-            'bp_used_at_max': 15615.00,
-            'net_pnl': 148.50,
-            'gross_pnl': 150.00,
-            'pnl_at_open': 75.00,
-            'pnl_at_close': 148.50,
-            'notes': 'Strong bid flow at support'
-        },
-        {
-            'symbol': 'AMD',
-            'strategy_type': 'secondary',
-            'entry_timestamp': '2024-01-16T14:00:00',
-            'exit_timestamp': '2024-01-16T15:30:00',
-            'entry_price': 155.25,
-            'exit_price': 157.80,
-            'price_at_max_size': 155.50,
-            'avg_price_at_max': 155.40,
-            'max_size': 75,
-            'bp_used_at_max': 11655.00,
-            'net_pnl': 178.50,
-            'gross_pnl': 180.00,
-            'pnl_at_open': None,
-            'pnl_at_close': 178.50,
-            'notes': 'Secondary offering complete, bounce'
-        },
-        {
-            'symbol': 'MSFT',
-            'strategy_type': 'swing',
-            'entry_timestamp': '2024-01-17T09:30:00',
-            'exit_timestamp': '2024-01-17T15:55:00',
-            'entry_price': 380.00,
-            'exit_price': 385.50,
-            'price_at_max_size': 381.00,
-            'avg_price_at_max': 380.50,
-            'max_size': 40,
-            'bp_used_at_max': 15220.00,
-            'net_pnl': 198.00,
-            'gross_pnl': 200.00,
-            'pnl_at_open': 20.00,
-            'pnl_at_close': 198.00,
-            'notes': 'Day swing on cloud announcement'
-        },
-
-        # Losing trades
-        {
-            'symbol': 'TSLA',
-            'strategy_type': 'news',
-            'entry_timestamp': '2024-01-18T09:35:00',
-            'exit_timestamp': '2024-01-18T10:05:00',
-            'entry_price': 248.00,
-            'exit_price': 245.50,
-            'price_at_max_size': 247.50,
-            'avg_price_at_max': 247.80,
-            'max_size': 60,
-            'bp_used_at_max': 14868.00,
-            'net_pnl': -137.80,
-            'gross_pnl': -138.00,
-            'pnl_at_open': -50.00,
-            'pnl_at_close': -137.80,
-            'notes': 'False breakout, stopped out'
-        },
-        {
-            'symbol': 'AAPL',
-            'strategy_type': 'orderflow_off_open',
-            'entry_timestamp': '2024-01-18T09:31:00',
-            'exit_timestamp': '2024-01-18T09:45:00',
-            'entry_price': 151.50,
-            'exit_price': 150.25,
-            'price_at_max_size': 151.25,
-            'avg_price_at_max': 151.40,
-            'max_size': 100,
-            'bp_used_at_max': 15140.00,
-            'net_pnl': -113.50,
-            'gross_pnl': -115.00,
-            'pnl_at_open': 0.00,
-            'pnl_at_close': -113.50,
-            'notes': 'Weak open, quick exit'
-        },
-        {
-            'symbol': 'META',
-            'strategy_type': 'curl',
-            'entry_timestamp': '2024-01-19T10:15:00',
-            'exit_timestamp': '2024-01-19T11:00:00',
-            'entry_price': 425.00,
-            'exit_price': 422.50,
-            'price_at_max_size': 424.50,
-            'avg_price_at_max': 424.80,
-            'max_size': 35,
-            'bp_used_at_max': 14868.00,
-            'net_pnl': -79.80,
-            'gross_pnl': -80.50,
-            'pnl_at_open': -25.00,
-            'pnl_at_close': -79.80,
-            'notes': 'Curl pattern failed, trend too strong'
-        },
-
-        # Breakeven/small trades
-        {
-            'symbol': 'GOOGL',
-            'strategy_type': 'earnings',
-            'entry_timestamp': '2024-01-19T16:05:00',
-            'exit_timestamp': '2024-01-19T16:15:00',
-            'entry_price': 145.50,
-            'exit_price': 145.65,
-            'price_at_max_size': 145.50,
-            'avg_price_at_max': 145.50,
-            'max_size': 80,
-            'bp_used_at_max': 11640.00,
-            'net_pnl': 10.50,
-            'gross_pnl': 12.00,
-            'pnl_at_open': None,
-            'pnl_at_close': 10.50,
-            'notes': 'After-hours earnings play, small gain'
-        },
-        {
-            'symbol': 'NFLX',
-            'strategy_type': 'roll',
-            'entry_timestamp': '2024-01-22T13:30:00',
-            'exit_timestamp': '2024-01-22T14:00:00',
-            'entry_price': 505.00,
-            'exit_price': 504.50,
-            'price_at_max_size': 505.25,
-            'avg_price_at_max': 505.10,
-            'max_size': 25,
-            'bp_used_at_max': 12627.50,
-            'net_pnl': -13.50,
-            'gross_pnl': -12.50,
-            'pnl_at_open': None,
-            'pnl_at_close': -13.50,
-            'notes': 'Choppy action, scratch trade'
-        },
-    ]
+    if trades is None:
+        trades = SAMPLE_TRADES
+    if batch_size is None:
+        batch_size = config.database_settings.get('insert_batch_size', 1000)
+
+    if not trades:
+        print("\n📊 Created 0 sample trades\n")
+        return
 
+    # One executemany INSERT per slice instead of a flush per trade
+    trade_ids = []
     with get_session() as session:
-        count = 0
-        for trade_data in sample_trades:
-            trade = create_trade(session, trade_data)
-            print(f"✅ Created: {trade}")
-            count += 1
+        for start in range(0, len(trades), batch_size):
+            trade_ids.extend(
+                bulk_create_trades(session, trades[start:start + batch_size])
+            )
 
-        print(f"\n📊 Created {count} sample trades\n")
+    print(f"✅ Created trades {trade_ids[0]}-{trade_ids[-1]}")
+    print(f"\n📊 Created {len(trade_ids)} sample trades\n")
 
 
 def show_database_info() -> None:
@@ -252,8 +280,13 @@ def show_database_info() -> None:
     - Database file size
     - Schema version info
     """
+    # Reflect every table's columns in one pass instead of one call per table
     inspector = inspect(engine)
-    tables = inspector.get_table_names()
+    columns_by_table = {
+        table: columns
+        for (_, table), columns in inspector.get_multi_columns().items()
+    }
+    tables = sorted(columns_by_table)
 
     print(f"\n{'='*60}")
     print("Database Information")
@@ -264,22 +297,29 @@ def show_database_info() -> None:
     if db_url.startswith('sqlite:///'):
         db_path = Path(db_url.replace('sqlite:///', ''))
         print(f"📁 Location: {db_path}")
-        if db_path.exists():
+        # One stat() call instead of exists() + stat()
+        try:
             size_mb = db_path.stat().st_size / (1024 * 1024)
             print(f"💾 Size: {size_mb:.2f} MB")
+        except FileNotFoundError:
+            pass
 
     # Show tables
     print(f"\n📊 Tables: {len(tables)}")
     for table in tables:
-        columns = inspector.get_columns(table)
-        print(f"  - {table} ({len(columns)} columns)")
+        print(f"  - {table} ({len(columns_by_table[table])} columns)")
 
     # Show row counts
     with get_session() as session:
         from src.database.models import Trade, DrawdownAnalysis
 
-        trade_count = session.query(Trade).count()
-        analysis_count = session.query(DrawdownAnalysis).count()
+        # Both counts as scalar subqueries of one SELECT (one round trip)
+        trade_count, analysis_count = session.execute(
+            select(
+                select(func.count()).select_from(Trade).scalar_subquery(),
+                select(func.count()).select_from(DrawdownAnalysis).scalar_subquery()
+            )
+        ).one()
 
         print(f"\n📈 Data:")
         print(f"  - Trades: {trade_count}")
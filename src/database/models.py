@@ -11,6 +11,29 @@ from typing import Optional, Dict, Any
 Base = declarative_base()
 
 
+def _columns_to_dict(obj: Any) -> Dict[str, Any]:
+    """Read every mapped column of a model instance into a dictionary.
+
+    Loaded values are read straight from the instance ``__dict__`` rather
+    than through the instrumented attribute descriptors, which matters for
+    bulk serialization. Keys follow column definition order.
+
+    Args:
+        obj: Trade or DrawdownAnalysis instance
+
+    Returns:
+        Dictionary mapping column attribute names to values
+    """
+    keys = type(obj)._column_keys
+    values = obj.__dict__
+    try:
+        return {key: values[key] for key in keys}
+    except KeyError:
+        # Expired or never-loaded attributes must go through the descriptor
+        # so SQLAlchemy can load them (or apply None for new objects)
+        return {key: getattr(obj, key) for key in keys}
+
+
 class Trade(Base):
     """Represents a single trading transaction.
 
@@ -63,9 +86,10 @@ class Trade(Base):
     # Primary Key
     trade_id = Column(Integer, primary_key=True, autoincrement=True)
 
-    # Trade Identification
-    symbol = Column(String(10), nullable=False, index=True)
-    strategy_type = Column(String(30), nullable=False, index=True)
+    # Trade Identification (indexed as the leading columns of
+    # idx_symbol_entry / idx_strategy_symbol below)
+    symbol = Column(String(10), nullable=False)
+    strategy_type = Column(String(30), nullable=False)
 
     # Timestamps (ISO 8601 format in UTC)
     entry_timestamp = Column(String(30), nullable=False, index=True)
@@ -119,6 +143,8 @@ class Trade(Base):
         CheckConstraint('entry_price > 0', name='positive_entry_price'),
         CheckConstraint('exit_price > 0', name='positive_exit_price'),
         Index('idx_symbol_entry', 'symbol', 'entry_timestamp'),
+        # Dashboard/analytics filters combine strategy and symbol
+        Index('idx_strategy_symbol', 'strategy_type', 'symbol'),
     )
 
     def __repr__(self) -> str:
@@ -134,30 +160,7 @@ class Trade(Base):
         Returns:
             Dictionary with all trade fields
         """
-        return {
-            'trade_id': self.trade_id,
-            'symbol': self.symbol,
-            'strategy_type': self.strategy_type,
-            'entry_timestamp': self.entry_timestamp,
-            'position_fully_established_timestamp': self.position_fully_established_timestamp,
-            'exit_timestamp': self.exit_timestamp,
-            'entry_price': self.entry_price,
-            'exit_price': self.exit_price,
-            'price_at_max_size': self.price_at_max_size,
-            'avg_price_at_max': self.avg_price_at_max,
-            'max_size': self.max_size,
-            'bp_used_at_max': self.bp_used_at_max,
-            'net_pnl': self.net_pnl,
-            'gross_pnl': self.gross_pnl,
-            'pnl_at_open': self.pnl_at_open,
-            'pnl_at_close': self.pnl_at_close,
-            'headline_title': self.headline_title,
-            'headline_content': self.headline_content,
-            'headline_score': self.headline_score,
-            'notes': self.notes,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at,
-        }
+        return _columns_to_dict(self)
 
 
 class DrawdownAnalysis(Base):
@@ -199,7 +202,8 @@ class DrawdownAnalysis(Base):
     # Primary Key
     analysis_id = Column(Integer, primary_key=True, autoincrement=True)
 
-    # Foreign Key
+    # Foreign Key (indexed: probed per trade by get_trades_without_analysis'
+    # NOT EXISTS and by per-trade analysis lookups)
     trade_id = Column(Integer, ForeignKey('trades.trade_id', ondelete='CASCADE'),
                      nullable=False, index=True)
 
@@ -267,21 +271,11 @@ class DrawdownAnalysis(Base):
         Returns:
             Dictionary with all analysis fields
         """
-        return {
-            'analysis_id': self.analysis_id,
-            'trade_id': self.trade_id,
-            'timeframe_minutes': self.timeframe_minutes,
-            'max_drawdown_pct': self.max_drawdown_pct,
-            'max_drawdown_dollar': self.max_drawdown_dollar,
-            'time_to_max_drawdown_seconds': self.time_to_max_drawdown_seconds,
-            'price_at_max_drawdown': self.price_at_max_drawdown,
-            'max_favorable_excursion_pct': self.max_favorable_excursion_pct,
-            'max_favorable_excursion_dollar': self.max_favorable_excursion_dollar,
-            'time_to_max_favorable_excursion_seconds': self.time_to_max_favorable_excursion_seconds,
-            'price_at_max_favorable_excursion': self.price_at_max_favorable_excursion,
-            'recovery_time_seconds': self.recovery_time_seconds,
-            'end_of_timeframe_pnl_pct': self.end_of_timeframe_pnl_pct,
-            'end_of_timeframe_pnl_dollar': self.end_of_timeframe_pnl_dollar,
-            'bar_count': self.bar_count,
-            'created_at': self.created_at,
-        }
+        return _columns_to_dict(self)
+
+
+# Column attribute names in definition order, read by _columns_to_dict()
+Trade._column_keys = tuple(column.key for column in Trade.__table__.columns)
+DrawdownAnalysis._column_keys = tuple(
+    column.key for column in DrawdownAnalysis.__table__.columns
+)
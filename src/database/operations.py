@@ -1,13 +1,28 @@
 """CRUD operations for trading analytics database."""
 
-from typing import Optional, List, Dict, Any
+import base64
+import json
+from typing import Optional, List, Dict, Any, Tuple, Sequence, Iterator
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, insert, select, tuple_
 from datetime import datetime
 
 from src.database.models import Trade, DrawdownAnalysis
 
 
+# Max IDs bound into a single IN (...) clause (SQLite's historical
+# limit is 999 host parameters)
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Rows buffered per fetch when streaming results with stream_trades()
+STREAM_CHUNK_SIZE = 1000
+
+# Bulk insert statements, built once and reused; SQLAlchemy's compiled
+# cache then serves every call without re-deriving the SQL
+_INSERT_TRADES = insert(Trade).returning(Trade.trade_id, sort_by_parameter_order=True)
+_INSERT_ANALYSES = insert(DrawdownAnalysis)
+
+
 def create_trade(session: Session, trade_data: Dict[str, Any]) -> Trade:
     """Create and persist a new trade record.
 
@@ -69,6 +84,42 @@ def get_trade_by_id(session: Session, trade_id: int) -> Optional[Trade]:
     return session.query(Trade).filter(Trade.trade_id == trade_id).first()
 
 
+def get_trade_rows_by_ids(
+    session: Session,
+    trade_ids: List[int],
+    columns: Tuple
+) -> Dict[int, Any]:
+    """Retrieve selected trade columns as lightweight rows in batched IN queries.
+
+    Rows are read-only named tuples without ORM identity-map or
+    change-tracking state, which makes them cheaper than Trade objects
+    for bulk reads and safe to share across threads.
+
+    Args:
+        session: Active database session
+        trade_ids: Primary keys of trades to load
+        columns: Trade columns to select (must include Trade.trade_id)
+
+    Returns:
+        Dictionary mapping trade_id to row (missing IDs are absent)
+
+    Example:
+        >>> rows = get_trade_rows_by_ids(
+        ...     session, [1, 2], (Trade.trade_id, Trade.symbol)
+        ... )
+        >>> print(rows[1].symbol)
+    """
+    rows_by_id = {}
+    unique_ids = list(dict.fromkeys(trade_ids))
+
+    for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+        chunk = unique_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+        for row in session.query(*columns).filter(Trade.trade_id.in_(chunk)):
+            rows_by_id[row.trade_id] = row
+
+    return rows_by_id
+
+
 def check_duplicate_trade(
     session: Session,
     symbol: str,
@@ -100,6 +151,107 @@ def check_duplicate_trade(
     ).first()
 
 
+def find_duplicate_trades(
+    session: Session,
+    keys: List[Tuple[str, str, str]]
+) -> Dict[Tuple[str, str, str], int]:
+    """Batch version of check_duplicate_trade for many trades at once.
+
+    Args:
+        session: Active database session
+        keys: (symbol, entry_timestamp, exit_timestamp) tuples to look up
+
+    Returns:
+        Dictionary mapping each key that already exists to its trade_id
+
+    Example:
+        >>> existing = find_duplicate_trades(session, [
+        ...     ('AAPL', '2024-01-15T09:30:00', '2024-01-15T10:15:00')
+        ... ])
+        >>> for key, trade_id in existing.items():
+        ...     print(f"Duplicate found: Trade ID {trade_id}")
+    """
+    existing = {}
+    unique_keys = list(dict.fromkeys(keys))
+
+    # Three bound parameters per key
+    chunk_size = IN_CLAUSE_CHUNK_SIZE // 3
+    for start in range(0, len(unique_keys), chunk_size):
+        chunk = unique_keys[start:start + chunk_size]
+        rows = session.query(
+            Trade.symbol, Trade.entry_timestamp, Trade.exit_timestamp, Trade.trade_id
+        ).filter(
+            tuple_(Trade.symbol, Trade.entry_timestamp, Trade.exit_timestamp).in_(chunk)
+        )
+        for symbol, entry_timestamp, exit_timestamp, trade_id in rows:
+            existing.setdefault((symbol, entry_timestamp, exit_timestamp), trade_id)
+
+    return existing
+
+
+def bulk_create_trades(
+    session: Session,
+    trades_data: List[Dict[str, Any]]
+) -> List[int]:
+    """Insert many trades with one executemany INSERT ... RETURNING.
+
+    Args:
+        session: Active database session
+        trades_data: Trade field dictionaries (same keys as create_trade)
+
+    Returns:
+        New trade_ids, in the same order as trades_data
+
+    Example:
+        >>> trade_ids = bulk_create_trades(session, [trade_data_1, trade_data_2])
+        >>> print(f"Created {len(trade_ids)} trades")
+    """
+    if not trades_data:
+        return []
+
+    result = session.execute(_INSERT_TRADES, trades_data)
+    return list(result.scalars())
+
+
+def _apply_trade_filters(
+    query,
+    symbol: Optional[str] = None,
+    strategy_type: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_pnl: Optional[float] = None,
+    max_pnl: Optional[float] = None
+):
+    """Apply the shared trade filters to a query over Trade.
+
+    Args:
+        query: Query selecting from Trade
+        symbol: Filter by stock ticker
+        strategy_type: Filter by strategy
+        start_date: ISO timestamp - filter trades after this date
+        end_date: ISO timestamp - filter trades before this date
+        min_pnl: Minimum net P&L
+        max_pnl: Maximum net P&L
+
+    Returns:
+        Filtered query
+    """
+    if symbol:
+        query = query.filter(Trade.symbol == symbol)
+    if strategy_type:
+        query = query.filter(Trade.strategy_type == strategy_type)
+    if start_date:
+        query = query.filter(Trade.entry_timestamp >= start_date)
+    if end_date:
+        query = query.filter(Trade.entry_timestamp <= end_date)
+    if min_pnl is not None:
+        query = query.filter(Trade.net_pnl >= min_pnl)
+    if max_pnl is not None:
+        query = query.filter(Trade.net_pnl <= max_pnl)
+
+    return query
+
+
 def get_all_trades(
     session: Session,
     symbol: Optional[str] = None,
@@ -122,7 +274,8 @@ def get_all_trades(
         min_pnl: Minimum net P&L
         max_pnl: Maximum net P&L
         limit: Maximum number of results
-        offset: Number of results to skip (for pagination)
+        offset: Number of results to skip (prefer get_trades_page() for
+            paging; OFFSET cost grows with page depth)
 
     Returns:
         List of Trade objects matching filters
@@ -137,21 +290,15 @@ def get_all_trades(
         ... )
         >>> print(f"Found {len(trades)} profitable AAPL news trades")
     """
-    query = session.query(Trade)
-
-    # Apply filters
-    if symbol:
-        query = query.filter(Trade.symbol == symbol)
-    if strategy_type:
-        query = query.filter(Trade.strategy_type == strategy_type)
-    if start_date:
-        query = query.filter(Trade.entry_timestamp >= start_date)
-    if end_date:
-        query = query.filter(Trade.entry_timestamp <= end_date)
-    if min_pnl is not None:
-        query = query.filter(Trade.net_pnl >= min_pnl)
-    if max_pnl is not None:
-        query = query.filter(Trade.net_pnl <= max_pnl)
+    query = _apply_trade_filters(
+        session.query(Trade),
+        symbol=symbol,
+        strategy_type=strategy_type,
+        start_date=start_date,
+        end_date=end_date,
+        min_pnl=min_pnl,
+        max_pnl=max_pnl
+    )
 
     # Order by entry time (most recent first)
     query = query.order_by(desc(Trade.entry_timestamp))
@@ -165,6 +312,157 @@ def get_all_trades(
     return query.all()
 
 
+def stream_trades(
+    session: Session,
+    columns: Sequence,
+    limit: Optional[int] = None,
+    **filters
+) -> Iterator[Any]:
+    """Stream selected trade columns as rows, fetched in chunks.
+
+    Unlike get_all_trades(), no Trade objects or identity-map entries are
+    built and the result is never materialized as one list, so peak
+    memory stays at one chunk regardless of how many trades match. The
+    session must stay open while the generator is consumed.
+
+    Args:
+        session: Active database session
+        columns: Trade columns to select
+        limit: Maximum number of results
+        **filters: Same filters as get_all_trades()
+
+    Yields:
+        Read-only named-tuple rows, most recent entry first
+
+    Example:
+        >>> rows = stream_trades(
+        ...     session, (Trade.trade_id, Trade.symbol), symbol='AAPL'
+        ... )
+        >>> df = pd.DataFrame.from_records(rows, columns=['ID', 'Symbol'])
+    """
+    stmt = _apply_trade_filters(select(*columns), **filters).order_by(
+        desc(Trade.entry_timestamp), desc(Trade.trade_id)
+    )
+    if limit:
+        stmt = stmt.limit(limit)
+
+    yield from session.execute(stmt.execution_options(yield_per=STREAM_CHUNK_SIZE))
+
+
+def encode_trade_cursor(entry_timestamp: str, trade_id: int) -> str:
+    """Encode a keyset position for get_trades_page() as an opaque string.
+
+    Args:
+        entry_timestamp: Entry timestamp of the last trade on a page
+        trade_id: ID of the last trade on a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([entry_timestamp, trade_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_trade_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a cursor produced by encode_trade_cursor().
+
+    Args:
+        cursor: Cursor string from a previous get_trades_page() call
+
+    Returns:
+        Tuple of (entry_timestamp, trade_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        entry_timestamp, trade_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return str(entry_timestamp), int(trade_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def get_trades_page(
+    session: Session,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    symbol: Optional[str] = None,
+    strategy_type: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_pnl: Optional[float] = None,
+    max_pnl: Optional[float] = None
+) -> Dict[str, Any]:
+    """Retrieve one page of trades using keyset (cursor) pagination.
+
+    Pages are ordered newest first by (entry_timestamp, trade_id). Instead
+    of OFFSET, which makes the database walk and discard every earlier
+    row, each page starts strictly after the previous page's last row, so
+    deep pages cost the same as the first. The entry_timestamp index
+    (which SQLite stores with the rowid, i.e. trade_id) serves both the
+    seek and the ordering.
+
+    Args:
+        session: Active database session
+        cursor: next_cursor from the previous page (None = first page)
+        limit: Maximum number of trades per page
+        symbol: Filter by stock ticker
+        strategy_type: Filter by strategy
+        start_date: ISO timestamp - filter trades after this date
+        end_date: ISO timestamp - filter trades before this date
+        min_pnl: Minimum net P&L
+        max_pnl: Maximum net P&L
+
+    Returns:
+        Dictionary with page data:
+        {
+            'data': List[Trade],
+            'next_cursor': str or None,
+            'has_more': bool
+        }
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    Example:
+        >>> page = get_trades_page(session, limit=20)
+        >>> while page['has_more']:
+        ...     page = get_trades_page(session, cursor=page['next_cursor'], limit=20)
+    """
+    query = _apply_trade_filters(
+        session.query(Trade),
+        symbol=symbol,
+        strategy_type=strategy_type,
+        start_date=start_date,
+        end_date=end_date,
+        min_pnl=min_pnl,
+        max_pnl=max_pnl
+    )
+
+    # Seek past the previous page
+    if cursor:
+        last_timestamp, last_id = decode_trade_cursor(cursor)
+        query = query.filter(or_(
+            Trade.entry_timestamp < last_timestamp,
+            and_(Trade.entry_timestamp == last_timestamp, Trade.trade_id < last_id)
+        ))
+
+    # Fetch one extra row to learn whether another page exists
+    trades = (
+        query.order_by(desc(Trade.entry_timestamp), desc(Trade.trade_id))
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(trades) > limit
+    trades = trades[:limit]
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_trade_cursor(trades[-1].entry_timestamp, trades[-1].trade_id)
+
+    return {'data': trades, 'next_cursor': next_cursor, 'has_more': has_more}
+
+
 def update_trade(session: Session, trade_id: int, updates: Dict[str, Any]) -> Trade:
     """Update existing trade record.
 
@@ -224,28 +522,107 @@ def delete_trade(session: Session, trade_id: int) -> bool:
     return True
 
 
-def get_trades_without_analysis(session: Session) -> List[Trade]:
+def get_trades_without_analysis(
+    session: Session,
+    limit: Optional[int] = None,
+    offset: Optional[int] = 0
+) -> List[Trade]:
     """Find trades that don't have any drawdown analysis records.
 
     Useful for identifying which trades need to be processed by the analysis engine.
 
     Args:
         session: Active database session
+        limit: Maximum number of results
+        offset: Number of results to skip (for pagination)
 
     Returns:
-        List of Trade objects missing analysis
+        List of Trade objects missing analysis, oldest trade_id first
 
     Example:
         >>> unprocessed = get_trades_without_analysis(session)
         >>> print(f"{len(unprocessed)} trades need analysis")
+        >>>
+        >>> # Next 10 trades to process
+        >>> next_batch = get_trades_without_analysis(session, limit=10)
     """
-    return (
+    # NOT EXISTS stops at the first analysis row per trade (one probe of
+    # the indexed drawdown_analysis.trade_id) instead of joining them all
+    has_analysis = (
+        session.query(DrawdownAnalysis.analysis_id)
+        .filter(DrawdownAnalysis.trade_id == Trade.trade_id)
+        .exists()
+    )
+    query = (
         session.query(Trade)
-        .outerjoin(DrawdownAnalysis)
-        .filter(DrawdownAnalysis.analysis_id == None)
-        .all()
+        .filter(~has_analysis)
+        .order_by(Trade.trade_id)
     )
 
+    # Pagination (applied in SQL so unneeded rows are never loaded)
+    if offset:
+        query = query.offset(offset)
+    if limit:
+        query = query.limit(limit)
+
+    return query.all()
+
+
+def get_analyzed_trade_count(session: Session) -> int:
+    """Count trades that have at least one drawdown analysis record.
+
+    Args:
+        session: Active database session
+
+    Returns:
+        Number of distinct trades with analysis
+
+    Example:
+        >>> analyzed = get_analyzed_trade_count(session)
+        >>> print(f"{analyzed} trades analyzed")
+    """
+    from sqlalchemy import func
+
+    return session.query(
+        func.count(func.distinct(DrawdownAnalysis.trade_id))
+    ).scalar()
+
+
+def get_analysis_counts(session: Session, trade_ids: List[int]) -> Dict[int, int]:
+    """Count existing analysis records for many trades in batched queries.
+
+    Args:
+        session: Active database session
+        trade_ids: Trade IDs to count analysis records for
+
+    Returns:
+        Dictionary mapping trade_id to record count (trades without
+        analysis are absent)
+
+    Example:
+        >>> counts = get_analysis_counts(session, [1, 2, 3])
+        >>> if counts.get(1):
+        ...     print(f"Trade 1 has {counts[1]} timeframes")
+    """
+    from sqlalchemy import func
+
+    counts = {}
+    unique_ids = list(dict.fromkeys(trade_ids))
+
+    for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+        chunk = unique_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+        rows = session.query(
+            DrawdownAnalysis.trade_id,
+            func.count(DrawdownAnalysis.analysis_id)
+        ).filter(
+            DrawdownAnalysis.trade_id.in_(chunk)
+        ).group_by(
+            DrawdownAnalysis.trade_id
+        )
+        counts.update(rows)
+
+    return counts
+
 
 def bulk_insert_analysis(
     session: Session,
@@ -283,9 +660,9 @@ def bulk_insert_analysis(
     if not analysis_records:
         return 0
 
-    # Use bulk insert for performance
-    session.bulk_insert_mappings(DrawdownAnalysis, analysis_records)
-    session.flush()
+    # One executemany INSERT (no per-row ORM objects); rows with the same
+    # keys are sent to the driver as a single batch
+    session.execute(_INSERT_ANALYSES, analysis_records)
 
     return len(analysis_records)
 
@@ -339,23 +716,7 @@ def get_trade_count(session: Session, **filters) -> int:
         >>> winning_trades = get_trade_count(session, min_pnl=0.01)
         >>> print(f"Win rate: {winning_trades / total_trades:.1%}")
     """
-    query = session.query(Trade)
-
-    # Apply same filters as get_all_trades
-    if 'symbol' in filters:
-        query = query.filter(Trade.symbol == filters['symbol'])
-    if 'strategy_type' in filters:
-        query = query.filter(Trade.strategy_type == filters['strategy_type'])
-    if 'start_date' in filters:
-        query = query.filter(Trade.entry_timestamp >= filters['start_date'])
-    if 'end_date' in filters:
-        query = query.filter(Trade.entry_timestamp <= filters['end_date'])
-    if 'min_pnl' in filters:
-        query = query.filter(Trade.net_pnl >= filters['min_pnl'])
-    if 'max_pnl' in filters:
-        query = query.filter(Trade.net_pnl <= filters['max_pnl'])
-
-    return query.count()
+    return _apply_trade_filters(session.query(Trade), **filters).count()
 
 
 def get_unique_symbols(session: Session) -> List[str]:
@@ -398,3 +759,119 @@ def get_strategies_summary(session: Session) -> Dict[str, int]:
     )
 
     return {strategy: count for strategy, count in result}
+
+
+def get_strategy_performance(session: Session) -> Dict[str, Dict[str, float]]:
+    """Get trade count and total net P&L by strategy type in one query.
+
+    Args:
+        session: Active database session
+
+    Returns:
+        Dictionary mapping strategy_type to {'count': int, 'total_pnl': float}
+
+    Example:
+        >>> performance = get_strategy_performance(session)
+        >>> for strategy, stats in performance.items():
+        ...     print(f"{strategy}: {stats['count']} trades, ${stats['total_pnl']:.2f}")
+    """
+    from sqlalchemy import func
+
+    result = (
+        session.query(
+            Trade.strategy_type,
+            func.count(Trade.trade_id),
+            func.coalesce(func.sum(Trade.net_pnl), 0.0)
+        )
+        .group_by(Trade.strategy_type)
+        .all()
+    )
+
+    return {
+        strategy: {'count': count, 'total_pnl': total_pnl}
+        for strategy, count, total_pnl in result
+    }
+
+
+def get_pnl_statistics(session: Session) -> Dict[str, float]:
+    """Get overall net P&L statistics computed by the database in one pass.
+
+    SQLite has no built-in standard deviation, so the sample standard
+    deviation is derived from the sum and sum of squares.
+
+    Args:
+        session: Active database session
+
+    Returns:
+        Dictionary with:
+        {
+            'total_trades': int,
+            'winning_trades': int,
+            'total_pnl': float,
+            'avg_pnl': float,
+            'std_pnl': float (sample std dev, 0.0 with fewer than 2 trades)
+        }
+
+    Example:
+        >>> stats = get_pnl_statistics(session)
+        >>> win_rate = stats['winning_trades'] / stats['total_trades'] * 100
+    """
+    from sqlalchemy import func, case
+
+    count, wins, total, total_sq = session.query(
+        func.count(Trade.trade_id),
+        func.coalesce(func.sum(case((Trade.net_pnl > 0, 1), else_=0)), 0),
+        func.coalesce(func.sum(Trade.net_pnl), 0.0),
+        func.coalesce(func.sum(Trade.net_pnl * Trade.net_pnl), 0.0)
+    ).one()
+
+    avg = total / count if count else 0.0
+
+    std_dev = 0.0
+    if count > 1:
+        # Clamp tiny negative values caused by floating point cancellation
+        variance = max((total_sq - count * avg * avg) / (count - 1), 0.0)
+        std_dev = variance ** 0.5
+
+    return {
+        'total_trades': count,
+        'winning_trades': wins,
+        'total_pnl': total,
+        'avg_pnl': avg,
+        'std_pnl': std_dev
+    }
+
+
+def get_data_version(session: Session) -> tuple:
+    """Get a cheap watermark that changes whenever trades or analysis change.
+
+    Combines row counts with the latest trade update time and analysis ID,
+    so inserts, deletes, and edits all produce a new value. Intended as a
+    cache key for derived analytics.
+
+    Args:
+        session: Active database session
+
+    Returns:
+        Tuple of (trade_count, latest_trade_update, analysis_count, max_analysis_id)
+
+    Example:
+        >>> version = get_data_version(session)
+        >>> if version != cached_version:
+        ...     refresh_analytics()
+    """
+    from sqlalchemy import func, select
+
+    trade_stats = select(
+        func.count(Trade.trade_id),
+        func.max(Trade.updated_at)
+    )
+    analysis_stats = select(
+        func.count(DrawdownAnalysis.analysis_id),
+        func.max(DrawdownAnalysis.analysis_id)
+    )
+
+    trade_count, latest_update = session.execute(trade_stats).one()
+    analysis_count, max_analysis_id = session.execute(analysis_stats).one()
+
+    return (trade_count, latest_update, analysis_count, max_analysis_id)
@@ -14,7 +14,10 @@ sys.path.insert(0, str(project_root))
 
 from src.utils.config import config
 from src.database.session import get_session
-from src.database.operations import get_trade_count, get_all_trades
+from src.database.models import Trade
+from src.database.operations import (
+    stream_trades, get_strategies_summary, get_pnl_statistics, get_data_version
+)
 
 # Streamlit page config
 st.set_page_config(
@@ -311,26 +314,61 @@ st.markdown("""
 
 st.divider()
 
+
+# Only the columns the Recent Activity table displays
+RECENT_TRADE_COLUMNS = (
+    Trade.trade_id, Trade.symbol, Trade.strategy_type,
+    Trade.entry_timestamp, Trade.exit_timestamp, Trade.net_pnl, Trade.max_size
+)
+
+
+# Only the current data version is read again, so keep just that entry
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_landing_stats(data_version: tuple) -> dict:
+    """Load landing-page stats and recent trades, cached per database version.
+
+    Args:
+        data_version: Watermark from get_data_version(); a new value means
+            trades or analysis changed and the cache entry is stale
+
+    Returns:
+        Dictionary with P&L statistics, per-strategy trade counts, and
+        display rows for the most recent trades
+    """
+    with get_session() as session:
+        return {
+            # Count, wins (SUM(CASE ...)) and P&L totals in one aggregate query
+            'pnl_stats': get_pnl_statistics(session),
+            'strategy_counts': get_strategies_summary(session),
+            'recent_trades': [{
+                'ID': t.trade_id,
+                'Symbol': t.symbol,
+                'Strategy': t.strategy_type,
+                'Entry': t.entry_timestamp[:16],
+                'Exit': t.exit_timestamp[:16],
+                'P&L': f"${t.net_pnl:.2f}",
+                'Size': t.max_size
+            } for t in stream_trades(session, RECENT_TRADE_COLUMNS, limit=5)]
+        }
+
+
 # Quick stats
 st.markdown("## [SYSTEM STATUS]")
 
 try:
     with get_session() as session:
-        total_trades = get_trade_count(session)
+        # Re-renders reuse the cached stats until the data changes
+        stats = load_landing_stats(get_data_version(session))
+        pnl_stats = stats['pnl_stats']
+        total_trades = pnl_stats['total_trades']
 
         if total_trades > 0:
-            # Get all trades for statistics
-            all_trades = get_all_trades(session)
-
-            # Calculate stats
-            total_pnl = sum(t.net_pnl for t in all_trades)
-            winning_trades = sum(1 for t in all_trades if t.net_pnl > 0)
+            total_pnl = pnl_stats['total_pnl']
+            winning_trades = pnl_stats['winning_trades']
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
 
-            # Strategy breakdown
-            strategy_counts = {}
-            for trade in all_trades:
-                strategy_counts[trade.strategy_type] = strategy_counts.get(trade.strategy_type, 0) + 1
+            # Strategy breakdown (GROUP BY in SQL)
+            strategy_counts = stats['strategy_counts']
             most_traded_strategy = max(strategy_counts.items(), key=lambda x: x[1])[0] if strategy_counts else "N/A"
 
             # Display metrics
@@ -362,16 +400,7 @@ try:
             st.markdown("## [RECENT ACTIVITY] - Last 5 Trades")
 
             import pandas as pd
-            recent_trades = all_trades[:5]
-            df = pd.DataFrame([{
-                'ID': t.trade_id,
-                'Symbol': t.symbol,
-                'Strategy': t.strategy_type,
-                'Entry': t.entry_timestamp[:16],
-                'Exit': t.exit_timestamp[:16],
-                'P&L': f"${t.net_pnl:.2f}",
-                'Size': t.max_size
-            } for t in recent_trades])
+            df = pd.DataFrame(stats['recent_trades'])
 
             st.dataframe(df, use_container_width=True, hide_index=True)
 
@@ -7,7 +7,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -148,25 +148,31 @@ def create_pnl_calendar(session: Session, year: int, month: int) -> go.Figure:
     Returns:
         Plotly figure with calendar heatmap
     """
-    # Get all trades for the month
-    from sqlalchemy import func, extract
+    # Aggregate the month's trades per day in SQL
     import calendar as cal
 
+    # Range predicate on the ISO timestamp string (rather than extracting
+    # year/month per row) so the entry_timestamp index can be used
+    month_start = f"{year}-{month:02d}-01"
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    month_end = f"{next_year}-{next_month:02d}-01"
+
     trades = session.query(
         func.date(Trade.entry_timestamp).label('date'),
         func.sum(Trade.net_pnl).label('daily_pnl'),
         func.count(Trade.trade_id).label('trade_count')
     ).filter(
-        extract('year', Trade.entry_timestamp) == year,
-        extract('month', Trade.entry_timestamp) == month
+        Trade.entry_timestamp >= month_start,
+        Trade.entry_timestamp < month_end
     ).group_by(
         func.date(Trade.entry_timestamp)
     ).all()
 
-    # Create DataFrame
-    df = pd.DataFrame(trades, columns=['date', 'pnl', 'count']) if trades else pd.DataFrame(columns=['date', 'pnl', 'count'])
-    if len(df) > 0:
-        df['date'] = pd.to_datetime(df['date'])
+    # Hash daily totals by 'YYYY-MM-DD' for O(1) lookup per calendar cell
+    # (str() because date() returns text on SQLite but a date on PostgreSQL)
+    daily_totals = {
+        str(row.date): (row.daily_pnl, row.trade_count) for row in trades
+    }
 
     # Create calendar grid (7 columns for weekdays)
     month_cal = cal.monthcalendar(year, month)
@@ -195,39 +201,39 @@ def create_pnl_calendar(session: Session, year: int, month: int) -> go.Figure:
                 week_hover.append("")
                 week_custom.append("")
             else:
-                date_obj = datetime(year, month, day)
-                day_data = df[df['date'] == date_obj] if len(df) > 0 else pd.DataFrame()
+                # ISO key doubles as the display string (no strftime per cell)
+                date_key = f"{year}-{month:02d}-{day:02d}"
+                day_data = daily_totals.get(date_key)
 
                 # Check if this is a weekend (Saturday=5, Sunday=6)
                 is_weekend = day_idx >= 5
 
                 # Check if date is in the future
-                is_future = date_obj.date() > today
+                is_future = dt_date(year, month, day) > today
 
-                if len(day_data) > 0:
+                if day_data is not None:
                     # Has trading data
-                    pnl = day_data['pnl'].iloc[0]
-                    count = day_data['count'].iloc[0]
+                    pnl, count = day_data
                     week_pnl.append(pnl)
                     week_text.append(f"{day}<br>${pnl:.0f}")
-                    week_hover.append(f"Date: {date_obj.strftime('%Y-%m-%d')}<br>P&L: ${pnl:.2f}<br>Trades: {count}")
+                    week_hover.append(f"Date: {date_key}<br>P&L: ${pnl:.2f}<br>Trades: {count}")
                 elif is_future:
                     # Future date - use None to not show color
                     week_pnl.append(None)
                     week_text.append(f"{day}")
-                    week_hover.append(f"Date: {date_obj.strftime('%Y-%m-%d')}<br>Future date")
+                    week_hover.append(f"Date: {date_key}<br>Future date")
                 elif is_weekend:
                     # Weekend with no trades - grey
                     week_pnl.append(0)
                     week_text.append(f"{day}")
-                    week_hover.append(f"Date: {date_obj.strftime('%Y-%m-%d')}<br>Weekend - No trades")
+                    week_hover.append(f"Date: {date_key}<br>Weekend - No trades")
                 else:
                     # Weekday with no trades
                     week_pnl.append(0)
                     week_text.append(f"{day}")
-                    week_hover.append(f"Date: {date_obj.strftime('%Y-%m-%d')}<br>No trades")
+                    week_hover.append(f"Date: {date_key}<br>No trades")
 
-                week_custom.append(f"{year}-{month:02d}-{day:02d}")
+                week_custom.append(date_key)
 
         z_data.append(week_pnl)
         text_data.append(week_text)
@@ -308,14 +314,13 @@ def create_entry_quality_scatter(session: Session, strategy_type: Optional[str]
 
     df = pd.DataFrame(results, columns=['trade_id', 'symbol', 'strategy', 'pnl', 'drawdown_5min'])
 
-    # Color by win/loss
-    df['color'] = df['pnl'].apply(lambda x: COLORS['profit'] if x > 0 else COLORS['loss'])
-    df['result'] = df['pnl'].apply(lambda x: 'WIN' if x > 0 else 'LOSS')
+    # Classify win/loss with one vectorized comparison instead of per-row lambdas
+    is_win = df['pnl'].to_numpy(dtype=np.float64) > 0
 
     fig = go.Figure()
 
-    for result, color in [('WIN', COLORS['profit']), ('LOSS', COLORS['loss'])]:
-        subset = df[df['result'] == result]
+    for result, color, mask in [('WIN', COLORS['profit'], is_win), ('LOSS', COLORS['loss'], ~is_win)]:
+        subset = df[mask]
         fig.add_trace(go.Scatter(
             x=subset['drawdown_5min'],
             y=subset['pnl'],
@@ -428,8 +433,6 @@ def create_daily_pnl_chart(trades: List[Trade], strategy_filter: Optional[str] =
     Returns:
         Plotly line chart with cumulative P&L over time
     """
-    from datetime import datetime
-
     # Filter by strategy if specified
     if strategy_filter and strategy_filter != "All Strategies":
         trades = [t for t in trades if t.strategy_type == strategy_filter]
@@ -451,23 +454,18 @@ def create_daily_pnl_chart(trades: List[Trade], strategy_filter: Optional[str] =
         )
         return fig
 
-    # Parse timestamps and sort by entry time
-    trade_data = []
-    for trade in trades:
-        # Parse ISO timestamp: 2025-10-02T09:03:21
-        dt = datetime.fromisoformat(trade.entry_timestamp)
-        time_str = dt.strftime('%H:%M:%S')  # e.g., "09:03:21"
-        trade_data.append({
-            'time': dt.time(),
-            'time_str': time_str,
-            'datetime': dt,
+    # Stored ISO-8601 timestamps sort chronologically as strings and carry the
+    # time of day at a fixed offset, so no per-trade datetime parsing is needed
+    # e.g. 2025-10-02T09:03:21 -> "09:03:21"
+    trade_data = [
+        {
+            'time_str': trade.entry_timestamp[11:19],
             'pnl': trade.net_pnl,
             'symbol': trade.symbol,
             'strategy': trade.strategy_type
-        })
-
-    # Sort by time
-    trade_data.sort(key=lambda x: x['datetime'])
+        }
+        for trade in sorted(trades, key=lambda t: t.entry_timestamp)
+    ]
 
     # Calculate cumulative P&L starting from 0
     cumulative_pnl = 0
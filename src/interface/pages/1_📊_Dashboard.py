@@ -625,13 +625,13 @@ if 'selected_trade_ids' not in st.session_state:
 
 st.divider()
 
-# Load all trades first (needed for both chart and filtering)
+# Check for any trades first (the full list is loaded below for the chart)
 with get_session() as session:
-    all_trades_initial = get_all_trades(session)
+    has_trades = bool(get_all_trades(session, limit=1))
     # Get filter options
     all_symbols = sorted(get_unique_symbols(session))
 
-if not all_trades_initial:
+if not has_trades:
     st.info("[INFO] No trades found. Add your first trade to get started.")
     st.stop()
 
@@ -805,6 +805,9 @@ try:
 
             df = pd.DataFrame(df_data)
 
+            # Index filtered trades by ID once for O(1) lookups below
+            trades_by_id = {t.trade_id: t for t in filtered_trades}
+
             # Initialize session state for strategy edits and original strategies
             if 'strategy_edits' not in st.session_state:
                 st.session_state.strategy_edits = {}
@@ -1116,7 +1119,7 @@ try:
             )
 
             if st.button("View Details"):
-                trade = next((t for t in filtered_trades if t.trade_id == trade_id_to_view), None)
+                trade = trades_by_id.get(trade_id_to_view)
 
                 if trade:
                     col1, col2 = st.columns(2)
@@ -21,7 +21,10 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.database.session import get_session
-from src.database.operations import get_all_trades, get_analysis_for_trade
+from src.database.operations import (
+    get_trade_count, get_analyzed_trade_count, get_strategy_performance,
+    get_pnl_statistics, get_data_version
+)
 from src.database.models import DrawdownAnalysis
 from src.utils.config import config
 
@@ -183,61 +186,75 @@ st.markdown("Advanced performance analysis and optimization insights")
 
 st.divider()
 
+
+# Only the current data version is read again, so keep just that entry
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_summary(data_version: tuple) -> dict:
+    """Load dashboard summary aggregates, cached per database version.
+
+    Args:
+        data_version: Watermark from get_data_version(); a new value means
+            trades or analysis changed and the cache entry is stale
+
+    Returns:
+        Dictionary with trade counts, P&L statistics, and strategy performance
+    """
+    with get_session() as session:
+        return {
+            # COUNT(*) rather than hydrating every Trade object just to len() it
+            'total_trades': get_trade_count(session),
+            # One COUNT(DISTINCT) instead of a query per trade
+            'analyzed_trades': get_analyzed_trade_count(session),
+            'pnl_stats': get_pnl_statistics(session),
+            'strategy_performance': get_strategy_performance(session)
+        }
+
+
 # Load data
 try:
     with get_session() as session:
-        all_trades = get_all_trades(session)
-
-        if not all_trades:
-            st.warning("[WARN] No trades found. Import trades to view analytics.")
-            st.stop()
-
-        # Get trades with analysis
-        trades_with_analysis = []
-        for trade in all_trades:
-            analysis = get_analysis_for_trade(session, trade.trade_id)
-            if analysis:
-                trades_with_analysis.append(trade)
-
-        total_trades = len(all_trades)
-        analyzed_trades = len(trades_with_analysis)
-
-        # Calculate metrics (works with or without analysis)
-        total_pnl = sum(t.net_pnl for t in all_trades)
-        winning_trades = sum(1 for t in all_trades if t.net_pnl > 0)
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-        avg_pnl = total_pnl / total_trades if total_trades > 0 else 0
-
-        # Strategy performance
-        strategy_pnl = {}
-        strategy_counts = {}
-        for trade in all_trades:
-            strat = trade.strategy_type
-            strategy_pnl[strat] = strategy_pnl.get(strat, 0) + trade.net_pnl
-            strategy_counts[strat] = strategy_counts.get(strat, 0) + 1
-
-        best_strategy = max(strategy_pnl.items(), key=lambda x: x[1])[0] if strategy_pnl else "N/A"
-        worst_strategy = min(strategy_pnl.items(), key=lambda x: x[1])[0] if strategy_pnl else "N/A"
-
-        # Sharpe ratio (proper calculation)
-        # Sharpe = (Mean Return - Risk Free Rate) / Std Dev
-        # Using risk-free rate of 0 for simplicity (can adjust to current T-bill rate ~4-5%)
-        if total_trades > 1:
-            pnl_list = [t.net_pnl for t in all_trades]
-            avg = sum(pnl_list) / len(pnl_list)
-
-            # Use sample standard deviation (n-1 denominator) for better estimate
-            variance = sum((x - avg) ** 2 for x in pnl_list) / (len(pnl_list) - 1)
-            std_dev = variance ** 0.5
-
-            # Sharpe ratio: (mean - risk_free_rate) / std_dev
-            # Assuming risk-free rate = 0 for per-trade Sharpe
-            sharpe = (avg / std_dev) if std_dev > 0 else 0
-
-            # Note: This is per-trade Sharpe, not annualized
-            # To annualize: multiply by sqrt(trading_days_per_year)
-        else:
-            sharpe = 0
+        data_version = get_data_version(session)
+
+    # Re-renders reuse the cached aggregates until the data changes
+    summary = load_summary(data_version)
+
+    if not summary['total_trades']:
+        st.warning("[WARN] No trades found. Import trades to view analytics.")
+        st.stop()
+
+    total_trades = summary['total_trades']
+    analyzed_trades = summary['analyzed_trades']
+
+    # Calculate metrics (works with or without analysis); aggregated in SQL
+    pnl_stats = summary['pnl_stats']
+    total_pnl = pnl_stats['total_pnl']
+    winning_trades = pnl_stats['winning_trades']
+    win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+    avg_pnl = pnl_stats['avg_pnl']
+
+    # Strategy performance (aggregated per strategy in SQL)
+    strategy_performance = summary['strategy_performance']
+    strategy_pnl = {strat: stats['total_pnl'] for strat, stats in strategy_performance.items()}
+    strategy_counts = {strat: stats['count'] for strat, stats in strategy_performance.items()}
+
+    best_strategy = max(strategy_pnl.items(), key=lambda x: x[1])[0] if strategy_pnl else "N/A"
+    worst_strategy = min(strategy_pnl.items(), key=lambda x: x[1])[0] if strategy_pnl else "N/A"
+
+    # Sharpe ratio (proper calculation)
+    # Sharpe = (Mean Return - Risk Free Rate) / Std Dev
+    # Using risk-free rate of 0 for simplicity (can adjust to current T-bill rate ~4-5%)
+    if total_trades > 1:
+        # Sample standard deviation (n-1 denominator), computed in SQL
+        std_dev = pnl_stats['std_pnl']
+
+        # Sharpe ratio: (mean - risk_free_rate) / std_dev
+        # Assuming risk-free rate = 0 for per-trade Sharpe
+        sharpe = (avg_pnl / std_dev) if std_dev > 0 else 0
+
+        # Note: This is per-trade Sharpe, not annualized
+        # To annualize: multiply by sqrt(trading_days_per_year)
+    else:
+        sharpe = 0
 
 except Exception as e:
     st.error(f"[ERROR] Failed to load data: {str(e)}")
@@ -8,6 +8,8 @@ This module implements a simple file-based cache to:
 
 import json
 import hashlib
+import os
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -140,8 +142,10 @@ class BarCache:
             if cached_at.tzinfo is None:
                 cached_at = UTC_TZ.localize(cached_at)
 
+            # Honor the TTL the entry was written with (see set())
+            ttl_hours = metadata.get('ttl_hours', self.ttl_hours)
             age = datetime.now(UTC_TZ) - cached_at
-            if age.total_seconds() > self.ttl_hours * 3600:
+            if age.total_seconds() > ttl_hours * 3600:
                 # Expired, delete files
                 cache_path.unlink(missing_ok=True)
                 meta_path.unlink(missing_ok=True)
@@ -191,6 +195,13 @@ class BarCache:
         cache_path = self._get_cache_path(cache_key)
         meta_path = self._get_metadata_path(cache_key)
 
+        # Batch analysis fetches from several threads, so entries are written
+        # to temp files and renamed into place: metadata first, then data,
+        # so a concurrent get() never sees a half-written or orphaned entry
+        tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_cache_path = cache_path.with_name(cache_path.name + tmp_suffix)
+        tmp_meta_path = meta_path.with_name(meta_path.name + tmp_suffix)
+
         ttl = ttl_hours if ttl_hours is not None else self.ttl_hours
 
         try:
@@ -201,9 +212,9 @@ class BarCache:
                 bar_copy['timestamp'] = bar['timestamp'].isoformat()
                 serializable_bars.append(bar_copy)
 
-            # Write cache data
-            with open(cache_path, 'w') as f:
-                json.dump(serializable_bars, f, indent=2)
+            # Write cache data (compact JSON; entries are read by code, not people)
+            with open(tmp_cache_path, 'w') as f:
+                json.dump(serializable_bars, f)
 
             # Write metadata
             metadata = {
@@ -213,12 +224,17 @@ class BarCache:
                 'symbol': bars[0].get('symbol', 'unknown') if bars else None
             }
 
-            with open(meta_path, 'w') as f:
+            with open(tmp_meta_path, 'w') as f:
                 json.dump(metadata, f, indent=2)
 
+            os.replace(tmp_meta_path, meta_path)
+            os.replace(tmp_cache_path, cache_path)
+
         except Exception as e:
             print(f"⚠️  Failed to cache data for {cache_key}: {e}")
             # Clean up partial writes
+            tmp_cache_path.unlink(missing_ok=True)
+            tmp_meta_path.unlink(missing_ok=True)
             cache_path.unlink(missing_ok=True)
             meta_path.unlink(missing_ok=True)
 
@@ -12,6 +12,7 @@ Note: Free tier has limitations:
 import os
 from typing import Optional, Dict, Any
 from datetime import datetime, date
+import threading
 import time
 
 from polygon import RESTClient
@@ -87,31 +88,38 @@ class PolygonClientWrapper:
         self.call_count = 0
         self.minute_window = 60.0  # seconds
 
+        # Batch analysis fetches bars from worker threads; serialize the
+        # call counter so the per-minute budget is shared, not per thread
+        self._rate_limit_lock = threading.Lock()
+
     def _enforce_rate_limit(self):
         """Enforce rate limiting based on plan tier.
 
-        For free tier: max 5 calls per minute, sleep if exceeded
+        For free tier: max 5 calls per minute, sleep if exceeded.
+        Thread-safe, so one client can be shared by concurrent fetches.
         """
         if self.plan_tier != 'free':
             return  # No strict rate limiting for paid plans
 
-        current_time = time.time()
-        elapsed = current_time - self.last_call_time
-
-        # Reset counter if more than 1 minute has passed
-        if elapsed > self.minute_window:
-            self.call_count = 0
-            self.last_call_time = current_time
+        # Held while sleeping so concurrent callers queue behind the wait
+        with self._rate_limit_lock:
+            current_time = time.time()
+            elapsed = current_time - self.last_call_time
 
-        # Check if we've hit the rate limit
-        if self.call_count >= self.rate_limit_calls:
-            sleep_time = self.minute_window - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # Reset counter if more than 1 minute has passed
+            if elapsed > self.minute_window:
                 self.call_count = 0
-                self.last_call_time = time.time()
+                self.last_call_time = current_time
+
+            # Check if we've hit the rate limit
+            if self.call_count >= self.rate_limit_calls:
+                sleep_time = self.minute_window - elapsed
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                    self.call_count = 0
+                    self.last_call_time = time.time()
 
-        self.call_count += 1
+            self.call_count += 1
 
     def test_connection(self, retries: int = 3) -> bool:
         """Verify API key is valid by making a test request.
@@ -175,7 +183,7 @@ class PolygonClientWrapper:
 
             if date_str:
                 # Parse date to check if it's a weekend
-                check_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                check_date = date.fromisoformat(date_str)
 
                 # Quick weekend check
                 if check_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
@@ -29,6 +29,14 @@ MARKET_CLOSE = dt_time(16, 0)  # 4:00 PM ET
 REGULAR_SESSION_MINUTES = 390  # 6.5 hours = 390 minutes
 REGULAR_SESSION_SECONDS = 23400  # 6.5 hours = 23,400 seconds
 
+# Bars for ranges that ended more recently than this may still be revised,
+# so they bypass the cache; older history is immutable and safe to reuse
+CACHE_FINALIZED_AFTER = timedelta(days=1)
+
+# Finalized bars never change, so their cache entries outlive the
+# configured TTL (which applies to everything else in the cache)
+FINALIZED_BARS_TTL_HOURS = 24 * 365
+
 # Timezones
 ET_TZ = pytz.timezone('America/New_York')
 UTC_TZ = pytz.UTC
@@ -166,7 +174,11 @@ class BarFetcher:
         to_timestamp = int(end_time.timestamp() * 1000)
 
         # Check cache first (include granularity in cache key)
-        if self.cache:
+        use_cache = (
+            self.cache is not None
+            and end_time <= datetime.now(UTC_TZ) - CACHE_FINALIZED_AFTER
+        )
+        if use_cache:
             cache_key = f"{granularity}_{self.cache.get_cache_key(symbol, start_time, end_time)}"
             cached_bars = self.cache.get(cache_key)
             if cached_bars:
@@ -217,9 +229,8 @@ class BarFetcher:
             print(f"[OK] Fetched {len(bars)} bars for {symbol}")
 
             # Cache results (include granularity in key)
-            if self.cache and bars:
-                cache_key = f"{granularity}_{self.cache.get_cache_key(symbol, start_time, end_time)}"
-                self.cache.set(cache_key, bars)
+            if use_cache and bars:
+                self.cache.set(cache_key, bars, ttl_hours=FINALIZED_BARS_TTL_HOURS)
 
             return bars
 
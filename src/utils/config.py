@@ -109,11 +109,21 @@ class Config:
         """Get validation rules."""
         return self.settings.get('validation', {})
 
+    @property
+    def database_settings(self) -> Dict[str, Any]:
+        """Get database tuning settings."""
+        return self.settings.get('database', {})
+
     @property
     def csv_import_settings(self) -> Dict[str, Any]:
         """Get CSV import settings."""
         return self.settings.get('csv_import', {})
 
+    @property
+    def polygon_data_settings(self) -> Dict[str, Any]:
+        """Get Polygon data fetching settings."""
+        return self.settings.get('polygon_data', {})
+
     # Convenience methods
 
     def is_valid_strategy(self, strategy_type: str) -> bool:
@@ -4,12 +4,18 @@ import csv
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
-from src.database.operations import create_trade, check_duplicate_trade
+from src.database.operations import (
+    create_trade, find_duplicate_trades, bulk_create_trades
+)
 from src.database.session import get_session
 from src.utils.validation import validate_csv_row, ValidationError
 from src.utils.config import config
 
 
+# Validated rows per duplicate-check query and multi-row INSERT
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+
 class CSVImportResult:
     """Container for import results with success/failure tracking.
 
@@ -113,10 +119,16 @@ def import_trades_from_csv(
     csv_path: Path,
     skip_header: bool = True,
     dry_run: bool = False,
-    delimiter: str = None
+    delimiter: str = None,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE
 ) -> CSVImportResult:
     """Import trades from CSV file.
 
+    Rows are streamed from the file and written in batches: one duplicate
+    lookup and one multi-row INSERT per ``batch_size`` valid rows, all in a
+    single transaction. Batches run in savepoints inside that transaction,
+    so an error that aborts the import rolls back every batch.
+
     CSV Format (pipe-separated):
         Symbol | Start | End | Net P&L | Gross P&L | Max Size |
         Price at Max Size | Avg Price at Max | BP Used at Max |
@@ -127,6 +139,7 @@ def import_trades_from_csv(
         skip_header: Whether first row is header (default True)
         dry_run: If True, validate but don't insert (default False)
         delimiter: Column delimiter (default from config, usually '|')
+        batch_size: Valid rows per database batch (default 1000)
 
     Returns:
         CSVImportResult with success/failure details
@@ -155,40 +168,21 @@ def import_trades_from_csv(
         # Use DictReader to automatically handle headers
         reader = csv.DictReader(f, delimiter=delimiter)
 
-        rows = list(reader)
-        result.total_rows = len(rows)
-
         # Note: Removed print statements to avoid encoding issues in Streamlit
         # All feedback is shown in the UI via CSVImportResult
 
         with get_session() as session:
-            for idx, row in enumerate(rows, start=2):  # Start at 2 (row 1 is header)
+            # (symbol, entry, exit) -> trade_id for rows inserted so far,
+            # so repeats within the file are skipped like existing trades
+            imported_keys = {}
+            batch = []
+
+            for idx, row in enumerate(reader, start=2):  # Start at 2 (row 1 is header)
+                result.total_rows += 1
+
                 try:
                     # Validate and convert row
-                    trade_data = validate_csv_row(row, idx)
-
-                    # Check for duplicate
-                    existing = check_duplicate_trade(
-                        session,
-                        trade_data['symbol'],
-                        trade_data['entry_timestamp'],
-                        trade_data['exit_timestamp']
-                    )
-
-                    if existing:
-                        result.add_skipped(
-                            idx,
-                            f"{trade_data['symbol']} at {trade_data['entry_timestamp']} (Trade ID: {existing.trade_id})"
-                        )
-                        continue
-
-                    if not dry_run:
-                        # Insert into database
-                        trade = create_trade(session, trade_data)
-                        result.add_success(trade.trade_id)
-                    else:
-                        # Dry run - just validate
-                        result.add_success(idx)
+                    batch.append((idx, validate_csv_row(row, idx)))
 
                 except ValidationError as e:
                     result.add_failure(idx, str(e))
@@ -196,9 +190,98 @@ def import_trades_from_csv(
                 except Exception as e:
                     result.add_failure(idx, f"Unexpected error: {e}")
 
+                if len(batch) >= batch_size:
+                    _import_batch(session, batch, imported_keys, result, dry_run)
+                    batch = []
+
+            if batch:
+                _import_batch(session, batch, imported_keys, result, dry_run)
+
     return result
 
 
+def _import_batch(
+    session,
+    batch: List[Tuple[int, Dict[str, Any]]],
+    imported_keys: Dict[Tuple[str, str, str], int],
+    result: CSVImportResult,
+    dry_run: bool
+):
+    """Skip duplicates in a batch of validated rows and insert the rest.
+
+    Args:
+        session: Active database session
+        batch: (row_number, trade_data) pairs that passed validation
+        imported_keys: Keys inserted earlier in this import (updated in place)
+        result: Import result to record outcomes on
+        dry_run: If True, don't insert
+    """
+    def trade_key(trade_data):
+        return (
+            trade_data['symbol'],
+            trade_data['entry_timestamp'],
+            trade_data['exit_timestamp']
+        )
+
+    def skip(row_num, key, trade_id):
+        result.add_skipped(row_num, f"{key[0]} at {key[1]} (Trade ID: {trade_id})")
+
+    # Check for duplicates (one query for the whole batch)
+    try:
+        existing = find_duplicate_trades(session, [trade_key(d) for _, d in batch])
+    except Exception as e:
+        for row_num, _ in batch:
+            result.add_failure(row_num, f"Unexpected error: {e}")
+        return
+
+    to_insert = []
+    repeats = []  # Rows repeating a key queued earlier in this batch
+    pending_keys = set()
+
+    for row_num, trade_data in batch:
+        key = trade_key(trade_data)
+        trade_id = existing.get(key, imported_keys.get(key))
+
+        if trade_id is not None:
+            skip(row_num, key, trade_id)
+        elif dry_run:
+            # Dry run - just validate
+            result.add_success(row_num)
+        elif key in pending_keys:
+            repeats.append((row_num, trade_data))
+        else:
+            pending_keys.add(key)
+            to_insert.append((row_num, key, trade_data))
+
+    if not to_insert:
+        return
+
+    try:
+        # Insert into database (one multi-row INSERT ... RETURNING)
+        with session.begin_nested():
+            trade_ids = bulk_create_trades(session, [d for _, _, d in to_insert])
+    except Exception:
+        # Retry row by row so one bad row doesn't fail the whole batch
+        trade_ids = []
+        for row_num, _, trade_data in to_insert:
+            try:
+                with session.begin_nested():
+                    trade_ids.append(create_trade(session, trade_data).trade_id)
+            except Exception as e:
+                trade_ids.append(None)
+                result.add_failure(row_num, f"Unexpected error: {e}")
+
+    for (row_num, key, _), trade_id in zip(to_insert, trade_ids):
+        if trade_id is not None:
+            imported_keys[key] = trade_id
+            result.add_success(trade_id)
+
+    # Repeats are now duplicates of the inserted rows (or get their own
+    # attempt if the first occurrence failed)
+    if repeats:
+        _import_batch(session, repeats, imported_keys, result, dry_run)
+
+
 def export_trades_to_csv(
     csv_path: Path,
     trades: List[Dict[str, Any]],
@@ -8,6 +8,7 @@ import tempfile
 import csv
 
 from src.database.models import Base
+from src.database.session import enable_sqlite_transactions
 
 
 @pytest.fixture(scope='function')
@@ -25,6 +26,7 @@ def test_db():
     """
     # Use in-memory SQLite for speed
     engine = create_engine('sqlite:///:memory:', echo=False)
+    enable_sqlite_transactions(engine)
     Base.metadata.create_all(engine)
 
     TestSession = sessionmaker(bind=engine)
@@ -7,18 +7,25 @@ This test suite validates:
 """
 
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 import pytz
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.analysis.drawdown import DrawdownCalculator
+from src.analysis.drawdown import (
+    DrawdownCalculator,
+    _scan_prefixes_loop,
+    _scan_prefixes_numpy
+)
 from src.analysis.processor import TradeAnalyzer
-from src.database.models import Trade, DrawdownAnalysis
+from src.database.models import Base, Trade, DrawdownAnalysis
 from src.database.operations import (
     create_trade,
     get_analysis_for_trade,
     bulk_insert_analysis
 )
+from src.database.session import enable_sqlite_transactions
 
 UTC_TZ = pytz.UTC
 ET_TZ = pytz.timezone('US/Eastern')
@@ -658,6 +665,335 @@ def test_trade_analyzer_integration(test_db):
         assert record.bar_count > 0
 
 
+def test_trade_analyzer_batch_concurrent(test_db):
+    """Test concurrent batch analysis keeps per-trade results in order."""
+    trade_ids = []
+    for symbol in ['AAA', 'BBB', 'CCC']:
+        trade = create_trade(test_db, {
+            'symbol': symbol,
+            'strategy_type': 'news',
+            'entry_timestamp': '2024-01-15T14:30:00Z',
+            'exit_timestamp': '2024-01-15T14:45:00Z',
+            'entry_price': 100.00,
+            'exit_price': 101.00,
+            'price_at_max_size': 100.00,
+            'avg_price_at_max': 100.00,
+            'max_size': 100,
+            'bp_used_at_max': 10000.00,
+            'net_pnl': 100.00,
+            'gross_pnl': 100.00
+        })
+        trade_ids.append(trade.trade_id)
+    test_db.commit()
+
+    class MockBarFetcher:
+        def fetch_bars_for_trade(self, trade, granularity='minute'):
+            """Return 15 minutes of flat bars (none for 'BBB')."""
+            if trade.symbol == 'BBB':
+                return []
+            entry_time = datetime.fromisoformat(trade.entry_timestamp)
+            return [{
+                'timestamp': entry_time + timedelta(minutes=i),
+                'open': 100.0,
+                'high': 100.5,
+                'low': 99.5,
+                'close': 100.0,
+                'volume': 1000
+            } for i in range(15)]
+
+    analyzer = TradeAnalyzer(
+        session=test_db,
+        bar_fetcher=MockBarFetcher(),
+        timeframes=[3, 5, 10],
+        max_concurrent=3
+    )
+
+    # Unknown trade ID is reported as a failure, not raised
+    summary = analyzer.analyze_batch(trade_ids + [99999])
+
+    assert summary['total_trades'] == 4
+    assert summary['successful'] == 2
+    assert summary['total_timeframes'] == 6
+    assert [f['trade_id'] for f in summary['failures']] == [trade_ids[1], 99999]
+    assert summary['failures'][0]['error'] == "No market data available"
+
+    # Force refresh replaces existing records rather than duplicating them
+    summary = analyzer.analyze_batch([trade_ids[0]], force_refresh=True)
+    assert summary['successful'] == 1
+    assert len(get_analysis_for_trade(test_db, trade_ids[0])) == 3
+
+    # Stop on first failure: trades after the failure are not analyzed
+    summary = analyzer.analyze_batch(
+        [trade_ids[1], trade_ids[2]], force_refresh=True, stop_on_error=True
+    )
+    assert summary['failed'] == 1
+    assert summary['successful'] == 0
+    # The trade never reached keeps its existing analysis
+    assert len(get_analysis_for_trade(test_db, trade_ids[2])) == 3
+
+    # A failed refetch leaves the old analysis in place
+    class NoDataFetcher:
+        def fetch_bars_for_trade(self, trade, granularity='minute'):
+            """Return no bars."""
+            return []
+
+    analyzer.bar_fetcher = NoDataFetcher()
+    summary = analyzer.analyze_batch(trade_ids[::2], force_refresh=True)
+    assert summary['failed'] == 2
+    assert len(get_analysis_for_trade(test_db, trade_ids[0])) == 3
+    assert len(get_analysis_for_trade(test_db, trade_ids[2])) == 3
+
+
+def test_trade_analyzer_batch_concurrent_window(test_db):
+    """Test concurrent batch analysis only queues a bounded window of fetches."""
+    trade_ids = []
+    for i in range(10):
+        trade = create_trade(test_db, {
+            'symbol': f'SYM{i}',
+            'strategy_type': 'news',
+            'entry_timestamp': '2024-01-15T14:30:00Z',
+            'exit_timestamp': '2024-01-15T14:45:00Z',
+            'entry_price': 100.00,
+            'exit_price': 101.00,
+            'price_at_max_size': 100.00,
+            'avg_price_at_max': 100.00,
+            'max_size': 100,
+            'bp_used_at_max': 10000.00,
+            'net_pnl': 100.00,
+            'gross_pnl': 100.00
+        })
+        trade_ids.append(trade.trade_id)
+    test_db.commit()
+
+    class MockBarFetcher:
+        def fetch_bars_for_trade(self, trade, granularity='minute'):
+            """Return 15 minutes of flat bars."""
+            entry_time = datetime.fromisoformat(trade.entry_timestamp)
+            return [{
+                'timestamp': entry_time + timedelta(minutes=i),
+                'open': 100.0,
+                'high': 100.5,
+                'low': 99.5,
+                'close': 100.0,
+                'volume': 1000
+            } for i in range(15)]
+
+    analyzer = TradeAnalyzer(
+        session=test_db,
+        bar_fetcher=MockBarFetcher(),
+        timeframes=[3, 5],
+        max_concurrent=2
+    )
+
+    # Record how many trades were queued each time one is stored
+    queued = []
+    queued_at_store = []
+    prepare_trade = analyzer._prepare_trade
+    store_analysis = analyzer._store_analysis
+
+    def counting_prepare(trade_id, *args, **kwargs):
+        queued.append(trade_id)
+        return prepare_trade(trade_id, *args, **kwargs)
+
+    def counting_store(*args, **kwargs):
+        queued_at_store.append(len(queued))
+        return store_analysis(*args, **kwargs)
+
+    analyzer._prepare_trade = counting_prepare
+    analyzer._store_analysis = counting_store
+
+    summary = analyzer.analyze_batch(trade_ids)
+
+    assert summary['successful'] == 10
+    # The trade being stored plus at most 2 * max_concurrent queued behind it
+    assert all(
+        count - stored <= 1 + 4 for stored, count in enumerate(queued_at_store)
+    )
+    assert queued_at_store[0] < len(trade_ids)
+
+
+def test_trade_analyzer_batch_stop_on_error_cancels_fetches(test_db):
+    """Test stopping on the first failure doesn't run the queued fetches."""
+    import threading
+    import time
+
+    trade_ids = []
+    for i in range(10):
+        trade = create_trade(test_db, {
+            'symbol': f'SYM{i}',
+            'strategy_type': 'news',
+            'entry_timestamp': '2024-01-15T14:30:00Z',
+            'exit_timestamp': '2024-01-15T14:45:00Z',
+            'entry_price': 100.00,
+            'exit_price': 101.00,
+            'price_at_max_size': 100.00,
+            'avg_price_at_max': 100.00,
+            'max_size': 100,
+            'bp_used_at_max': 10000.00,
+            'net_pnl': 100.00,
+            'gross_pnl': 100.00
+        })
+        trade_ids.append(trade.trade_id)
+    test_db.commit()
+
+    fetched = []
+    lock = threading.Lock()
+
+    class MockBarFetcher:
+        def fetch_bars_for_trade(self, trade, granularity='minute'):
+            """Fail the first trade at once; the rest are slow fetches."""
+            with lock:
+                fetched.append(trade.symbol)
+            if trade.symbol != 'SYM0':
+                time.sleep(0.2)
+            return []
+
+    analyzer = TradeAnalyzer(
+        session=test_db,
+        bar_fetcher=MockBarFetcher(),
+        timeframes=[3, 5],
+        max_concurrent=2
+    )
+    summary = analyzer.analyze_batch(trade_ids, stop_on_error=True)
+
+    assert summary['failed'] == 1
+    # Only fetches already running when the batch stopped may complete;
+    # the rest of the 2 * max_concurrent window is cancelled
+    assert len(fetched) <= 3
+
+
+def test_trade_analyzer_batch_failed_insert_isolated(test_db, monkeypatch):
+    """Test a failed insert in a batch doesn't discard other trades' results."""
+    import src.analysis.processor as processor
+
+    trade_ids = []
+    for symbol in ['AAA', 'BBB', 'CCC']:
+        trade = create_trade(test_db, {
+            'symbol': symbol,
+            'strategy_type': 'news',
+            'entry_timestamp': '2024-01-15T14:30:00Z',
+            'exit_timestamp': '2024-01-15T14:45:00Z',
+            'entry_price': 100.00,
+            'exit_price': 101.00,
+            'price_at_max_size': 100.00,
+            'avg_price_at_max': 100.00,
+            'max_size': 100,
+            'bp_used_at_max': 10000.00,
+            'net_pnl': 100.00,
+            'gross_pnl': 100.00
+        })
+        trade_ids.append(trade.trade_id)
+    test_db.commit()
+
+    class MockBarFetcher:
+        def fetch_bars_for_trade(self, trade, granularity='minute'):
+            """Return 15 minutes of flat bars."""
+            entry_time = datetime.fromisoformat(trade.entry_timestamp)
+            return [{
+                'timestamp': entry_time + timedelta(minutes=i),
+                'open': 100.0,
+                'high': 100.5,
+                'low': 99.5,
+                'close': 100.0,
+                'volume': 1000
+            } for i in range(15)]
+
+    def failing_insert(session, records):
+        """Insert the records, then fail for trade 'BBB'."""
+        inserted = bulk_insert_analysis(session, records)
+        if records[0]['trade_id'] == trade_ids[1]:
+            raise RuntimeError("insert failed")
+        return inserted
+
+    monkeypatch.setattr(processor, 'bulk_insert_analysis', failing_insert)
+
+    analyzer = TradeAnalyzer(
+        session=test_db,
+        bar_fetcher=MockBarFetcher(),
+        timeframes=[3, 5],
+        max_concurrent=3
+    )
+    summary = analyzer.analyze_batch(trade_ids)
+
+    assert summary['successful'] == 2
+    assert [f['trade_id'] for f in summary['failures']] == [trade_ids[1]]
+
+    # Only the failed trade's savepoint was rolled back
+    test_db.rollback()
+    assert len(get_analysis_for_trade(test_db, trade_ids[0])) == 2
+    assert len(get_analysis_for_trade(test_db, trade_ids[1])) == 0
+    assert len(get_analysis_for_trade(test_db, trade_ids[2])) == 2
+
+
+def test_trade_analyzer_batch_commits_at_checkpoints(tmp_path, monkeypatch):
+    """Test batch results only become visible to other connections at commits."""
+    import sqlite3
+    import src.analysis.processor as processor
+
+    db_path = tmp_path / 'batch.db'
+    engine = create_engine(f'sqlite:///{db_path}')
+    enable_sqlite_transactions(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    trade_ids = []
+    for symbol in ['AAA', 'BBB', 'CCC']:
+        trade = create_trade(session, {
+            'symbol': symbol,
+            'strategy_type': 'news',
+            'entry_timestamp': '2024-01-15T14:30:00Z',
+            'exit_timestamp': '2024-01-15T14:45:00Z',
+            'entry_price': 100.00,
+            'exit_price': 101.00,
+            'price_at_max_size': 100.00,
+            'avg_price_at_max': 100.00,
+            'max_size': 100,
+            'bp_used_at_max': 10000.00,
+            'net_pnl': 100.00,
+            'gross_pnl': 100.00
+        })
+        trade_ids.append(trade.trade_id)
+    session.commit()
+
+    reader = sqlite3.connect(db_path)
+    visible_at_fetch = []
+
+    class MockBarFetcher:
+        def fetch_bars_for_trade(self, trade, granularity='minute'):
+            """Record committed analysis rows, then return 15 flat bars."""
+            visible_at_fetch.append(
+                reader.execute('SELECT COUNT(*) FROM drawdown_analysis').fetchone()[0]
+            )
+            entry_time = datetime.fromisoformat(trade.entry_timestamp)
+            return [{
+                'timestamp': entry_time + timedelta(minutes=i),
+                'open': 100.0,
+                'high': 100.5,
+                'low': 99.5,
+                'close': 100.0,
+                'volume': 1000
+            } for i in range(15)]
+
+    monkeypatch.setattr(processor, 'BATCH_COMMIT_INTERVAL', 2)
+
+    analyzer = TradeAnalyzer(
+        session=session,
+        bar_fetcher=MockBarFetcher(),
+        timeframes=[3, 5],
+        max_concurrent=1
+    )
+    summary = analyzer.analyze_batch(trade_ids)
+
+    assert summary['successful'] == 3
+    # Trade 1's rows stay uncommitted until the checkpoint after trade 2
+    assert visible_at_fetch == [0, 0, 4]
+    assert reader.execute('SELECT COUNT(*) FROM drawdown_analysis').fetchone()[0] == 6
+
+    reader.close()
+    session.close()
+    engine.dispose()
+
+
 # ============================================================================
 # TEST 9: TIMEZONE HANDLING
 # ============================================================================
@@ -792,3 +1128,84 @@ def test_no_recovery_partial_return(calculator, sample_entry_time):
 
     # Should NOT detect recovery (didn't reach 100.00)
     assert metrics['recovery_time_seconds'] is None
+
+
+def test_array_path_matches_dict_path(calculator, sample_entry_time):
+    """Test calculate_all_timeframes_arr agrees with the bar-dict entry point."""
+    entry_price = 100.00
+
+    # Deliberately unsorted input; _bars_to_soa must sort chronologically
+    bars = [
+        {
+            'timestamp': sample_entry_time + timedelta(minutes=i),
+            'open': 100.00,
+            'high': 100.00 + (i % 4) * 0.5,
+            'low': 100.00 - (i % 7) * 0.25,
+            'close': 100.00 + (i % 3) * 0.1,
+            'volume': 1000
+        }
+        for i in reversed(range(30))
+    ]
+
+    ts_ns, lows, highs, closes = calculator._bars_to_soa(bars)
+    assert list(ts_ns) == sorted(ts_ns)
+    assert lows[0] == 100.00 and highs[1] == 100.50
+
+    timeframes = [3, 5, 10, 15, 30]
+    from_arrays = calculator.calculate_all_timeframes_arr(
+        ts_ns, lows, highs, closes,
+        entry_price=entry_price,
+        entry_time=sample_entry_time,
+        timeframes=timeframes,
+        position_size=100
+    )
+    from_dicts = calculator.calculate_all_timeframes(
+        bars=bars,
+        entry_price=entry_price,
+        entry_time=sample_entry_time,
+        timeframes=timeframes,
+        position_size=100
+    )
+
+    assert from_arrays == from_dicts
+    assert from_arrays[0]['time_to_max_drawdown_seconds'] == 180
+    assert isinstance(from_arrays[0]['time_to_max_drawdown_seconds'], int)
+
+
+def test_scan_kernels_agree(calculator, sample_entry_time):
+    """Test the Numba-compilable prefix scan matches the NumPy fallback."""
+    entry_price = 100.00
+
+    # Drawdown, recovery, deeper drawdown (resets recovery), final recovery
+    lows = [99.5, 98.0, 99.0, 99.8, 97.0, 97.0, 99.0, 100.5, 101.0]
+    highs = [100.2, 99.0, 100.0, 100.4, 98.0, 99.0, 100.0, 101.5, 101.5]
+    bars = [
+        {
+            'timestamp': sample_entry_time + timedelta(minutes=i),
+            'open': lows[i],
+            'high': highs[i],
+            'low': lows[i],
+            'close': lows[i],
+            'volume': 1000
+        }
+        for i in range(len(lows))
+    ]
+    ts_ns, low_arr, high_arr, _ = calculator._bars_to_soa(bars)
+
+    # Ascending cutoffs, including one before the first bar
+    cutoffs = np.array(
+        [int(ts_ns[0]) - 1] + [int(ts_ns[0]) + m * 60_000_000_000 for m in (0, 2, 3, 5, 8, 60)],
+        dtype=np.int64
+    )
+    from_loop = _scan_prefixes_loop(low_arr, high_arr, ts_ns, entry_price, cutoffs)
+    from_numpy = _scan_prefixes_numpy(low_arr, high_arr, ts_ns, entry_price, cutoffs)
+    for loop_values, numpy_values in zip(from_loop, from_numpy):
+        assert list(loop_values) == list(numpy_values)
+
+    bar_counts, drawdown_idxs, mfe_idxs, recovery_idxs = from_loop
+    assert list(bar_counts) == [0, 1, 3, 4, 6, 9, 9]
+    # 3-min window: drawdown at index 1, recovered at index 2
+    assert (drawdown_idxs[3], recovery_idxs[3]) == (1, 2)
+    # Full window: deepest low is the first 97.0 (index 4), recovery at index 6
+    assert (drawdown_idxs[-1], mfe_idxs[-1], recovery_idxs[-1]) == (4, 7, 6)
+    assert drawdown_idxs[0] == -1 and recovery_idxs[0] == -1
@@ -1,12 +1,18 @@
 """Tests for CSV import functionality."""
 
+import csv
+import sqlite3
 import pytest
 from pathlib import Path
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 from src.utils.csv_processor import (
     import_trades_from_csv, CSVImportResult,
     validate_csv_file
 )
+from src.database.models import Base
+from src.database.session import enable_sqlite_transactions
 
 
 def test_csv_import_result_initialization():
@@ -82,6 +88,46 @@ def test_import_invalid_csv(test_db, invalid_csv_file):
     assert result.failure_count > 0
 
 
+def test_import_failure_rolls_back_earlier_batches(tmp_path, monkeypatch):
+    """Test an import that fails partway through leaves no batches applied."""
+    import src.database.session as session_module
+
+    db_path = tmp_path / 'import.db'
+    engine = create_engine(f'sqlite:///{db_path}')
+    enable_sqlite_transactions(engine)
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(session_module, 'SessionLocal', sessionmaker(bind=engine))
+
+    # Enough valid rows to span several batches and read buffers, then a
+    # line that is not valid UTF-8
+    csv_path = tmp_path / 'trades.csv'
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter='|')
+        writer.writerow([
+            'Symbol', 'Start', 'End', 'Net P&L', 'Gross P&L',
+            'Max Size', 'Price at Max Size', 'Avg Price at Max',
+            'BP Used at Max', 'P&L at Open', 'P&L at Close'
+        ])
+        for day in range(1, 29):
+            for minute in range(10):
+                writer.writerow([
+                    'AAPL', f'2024-02-{day:02d} 10:{minute:02d}:00',
+                    f'2024-02-{day:02d} 11:{minute:02d}:00',
+                    '215.00', '225.00', '100', '150.50', '150.40',
+                    '15040.00', '50.00', '215.00'
+                ])
+    with open(csv_path, 'ab') as f:
+        f.write(b'\xff\xfe|broken\n')
+
+    with pytest.raises(UnicodeDecodeError):
+        import_trades_from_csv(csv_path, batch_size=10)
+
+    reader = sqlite3.connect(db_path)
+    assert reader.execute('SELECT COUNT(*) FROM trades').fetchone()[0] == 0
+    reader.close()
+    engine.dispose()
+
+
 def test_import_nonexistent_file(test_db):
     """Test importing non-existent file raises error."""
     with pytest.raises(FileNotFoundError):
@@ -32,6 +32,22 @@ def test_trade_to_dict(test_db, sample_trade_data):
     assert 'trade_id' in trade_dict
 
 
+def test_to_dict_loaded_and_expired(test_db, sample_trade_data):
+    """Test to_dict() gives the same result from loaded and expired state."""
+    trade = Trade(**sample_trade_data)
+    assert trade.to_dict()['trade_id'] is None  # Not yet flushed
+
+    test_db.add(trade)
+    test_db.commit()
+
+    expired = trade.to_dict()  # Commit expired the attributes
+    loaded = trade.to_dict()   # Now read from the loaded state
+
+    assert loaded == expired
+    assert list(loaded) == list(Trade._column_keys)
+    assert loaded['created_at'] is not None
+
+
 def test_trade_repr(test_db, sample_trade_data):
     """Test Trade.__repr__() string representation."""
     trade = Trade(**sample_trade_data)
@@ -6,7 +6,11 @@ from src.database.operations import (
     create_trade, get_trade_by_id, get_all_trades,
     update_trade, delete_trade, get_trades_without_analysis,
     bulk_insert_analysis, get_analysis_for_trade,
-    get_trade_count, get_unique_symbols, get_strategies_summary
+    get_trade_count, get_unique_symbols, get_strategies_summary,
+    get_strategy_performance, get_pnl_statistics, get_data_version,
+    get_analyzed_trade_count, get_trade_rows_by_ids,
+    get_analysis_counts, find_duplicate_trades, bulk_create_trades,
+    get_trades_page, stream_trades
 )
 from src.database.models import Trade, DrawdownAnalysis
 
@@ -132,6 +136,40 @@ def test_pagination(test_db, sample_trade_data):
     assert page1[0].symbol != page2[0].symbol
 
 
+def test_get_trades_page_keyset(test_db, sample_trade_data):
+    """Test cursor pagination walks every trade once, newest first."""
+    # Two trades share each entry time so the trade_id tiebreak is exercised
+    for i in range(5):
+        data = sample_trade_data.copy()
+        data['symbol'] = f'SYM{i}'
+        data['entry_timestamp'] = f'2024-01-1{i // 2}T09:31:00'
+        create_trade(test_db, data)
+    test_db.commit()
+
+    seen = []
+    page = get_trades_page(test_db, limit=2)
+    seen.extend(page['data'])
+    while page['has_more']:
+        page = get_trades_page(test_db, cursor=page['next_cursor'], limit=2)
+        seen.extend(page['data'])
+
+    assert page['next_cursor'] is None
+    assert [t.trade_id for t in seen] == [
+        t.trade_id for t in sorted(
+            seen, key=lambda t: (t.entry_timestamp, t.trade_id), reverse=True
+        )
+    ]
+    assert len({t.trade_id for t in seen}) == 5
+
+    # Filters apply across pages
+    page = get_trades_page(test_db, symbol='SYM3', limit=2)
+    assert [t.symbol for t in page['data']] == ['SYM3']
+    assert page['has_more'] is False
+
+    with pytest.raises(ValueError):
+        get_trades_page(test_db, cursor='not-a-cursor')
+
+
 def test_update_trade(test_db, sample_trade_data):
     """Test updating a trade."""
     trade = create_trade(test_db, sample_trade_data)
@@ -202,6 +240,18 @@ def test_get_trades_without_analysis(test_db, sample_trade_data, sample_analysis
     assert missing[0].trade_id == trade2.trade_id
 
 
+def test_get_trades_without_analysis_pagination(test_db, sample_trade_data):
+    """Test limit/offset are applied in trade_id order."""
+    trade_ids = [create_trade(test_db, sample_trade_data).trade_id for _ in range(3)]
+    test_db.commit()
+
+    first = get_trades_without_analysis(test_db, limit=2)
+    rest = get_trades_without_analysis(test_db, limit=2, offset=2)
+
+    assert [t.trade_id for t in first] == trade_ids[:2]
+    assert [t.trade_id for t in rest] == trade_ids[2:]
+
+
 def test_bulk_insert_analysis(test_db, sample_trade_data):
     """Test bulk inserting analysis records."""
     trade = create_trade(test_db, sample_trade_data)
@@ -300,3 +350,169 @@ def test_get_strategies_summary(test_db, sample_trade_data, losing_trade_data):
 
     assert summary['news'] == 2
     assert summary['breakout_breakdown'] == 1
+
+
+def test_get_strategy_performance(test_db, sample_trade_data, losing_trade_data):
+    """Test getting trade count and total P&L by strategy."""
+    create_trade(test_db, sample_trade_data)  # news, +215.00
+    create_trade(test_db, sample_trade_data)  # news, +215.00
+    create_trade(test_db, losing_trade_data)  # breakout_breakdown, -137.80
+    test_db.commit()
+
+    performance = get_strategy_performance(test_db)
+
+    assert performance['news']['count'] == 2
+    assert performance['news']['total_pnl'] == pytest.approx(430.00)
+    assert performance['breakout_breakdown']['count'] == 1
+    assert performance['breakout_breakdown']['total_pnl'] == pytest.approx(-137.80)
+
+
+def test_get_pnl_statistics(test_db, sample_trade_data, losing_trade_data):
+    """Test overall P&L statistics aggregated in SQL."""
+    import statistics
+
+    create_trade(test_db, sample_trade_data)  # +215.00
+    create_trade(test_db, sample_trade_data)  # +215.00
+    create_trade(test_db, losing_trade_data)  # -137.80
+    test_db.commit()
+
+    stats = get_pnl_statistics(test_db)
+    pnls = [215.00, 215.00, -137.80]
+
+    assert stats['total_trades'] == 3
+    assert stats['winning_trades'] == 2
+    assert stats['total_pnl'] == pytest.approx(sum(pnls))
+    assert stats['avg_pnl'] == pytest.approx(statistics.mean(pnls))
+    assert stats['std_pnl'] == pytest.approx(statistics.stdev(pnls))
+
+
+def test_get_pnl_statistics_empty(test_db):
+    """Test P&L statistics with no trades."""
+    stats = get_pnl_statistics(test_db)
+
+    assert stats['total_trades'] == 0
+    assert stats['total_pnl'] == 0.0
+    assert stats['std_pnl'] == 0.0
+
+
+def test_get_data_version_changes_with_data(test_db, sample_trade_data, sample_analysis_data):
+    """Test data version watermark changes on insert, analysis, and delete."""
+    empty_version = get_data_version(test_db)
+
+    trade = create_trade(test_db, sample_trade_data)
+    test_db.commit()
+    trade_version = get_data_version(test_db)
+    assert trade_version != empty_version
+    assert get_data_version(test_db) == trade_version  # Stable without changes
+
+    sample_analysis_data['trade_id'] = trade.trade_id
+    bulk_insert_analysis(test_db, [sample_analysis_data])
+    test_db.commit()
+    analysis_version = get_data_version(test_db)
+    assert analysis_version != trade_version
+
+    delete_trade(test_db, trade.trade_id)
+    test_db.commit()
+    assert get_data_version(test_db) != analysis_version
+
+
+def test_get_analyzed_trade_count(test_db, sample_trade_data, sample_analysis_data):
+    """Test counting distinct trades with analysis."""
+    analyzed = create_trade(test_db, sample_trade_data)
+    create_trade(test_db, sample_trade_data)  # No analysis
+    test_db.commit()
+
+    assert get_analyzed_trade_count(test_db) == 0
+
+    # Two timeframes for the same trade count once
+    records = []
+    for timeframe in (5, 10):
+        record = sample_analysis_data.copy()
+        record['trade_id'] = analyzed.trade_id
+        record['timeframe_minutes'] = timeframe
+        records.append(record)
+    bulk_insert_analysis(test_db, records)
+    test_db.commit()
+
+    assert get_analyzed_trade_count(test_db) == 1
+
+
+def test_get_trade_rows_by_ids(test_db, sample_trade_data, losing_trade_data):
+    """Test loading selected trade columns as plain rows."""
+    trade1 = create_trade(test_db, sample_trade_data)
+    trade2 = create_trade(test_db, losing_trade_data)
+    test_db.commit()
+
+    rows = get_trade_rows_by_ids(
+        test_db,
+        [trade1.trade_id, trade2.trade_id, 99999],
+        (Trade.trade_id, Trade.symbol)
+    )
+
+    assert set(rows) == {trade1.trade_id, trade2.trade_id}
+    assert rows[trade2.trade_id].symbol == losing_trade_data['symbol']
+    assert not isinstance(rows[trade1.trade_id], Trade)
+
+
+def test_stream_trades(test_db, sample_trade_data, losing_trade_data):
+    """Test streaming selected columns with filters and a limit."""
+    create_trade(test_db, sample_trade_data)
+    trade2 = create_trade(test_db, losing_trade_data)
+    test_db.commit()
+
+    columns = (Trade.trade_id, Trade.net_pnl)
+    rows = list(stream_trades(test_db, columns))
+    expected = get_all_trades(test_db)
+
+    assert [row.trade_id for row in rows] == [t.trade_id for t in expected]
+    assert not isinstance(rows[0], Trade)
+
+    losers = list(stream_trades(test_db, columns, max_pnl=0))
+    assert [row.trade_id for row in losers] == [trade2.trade_id]
+
+    assert len(list(stream_trades(test_db, columns, limit=1))) == 1
+
+
+def test_get_analysis_counts(test_db, sample_trade_data, losing_trade_data):
+    """Test counting analysis records for many trades at once."""
+    trade1 = create_trade(test_db, sample_trade_data)
+    trade2 = create_trade(test_db, losing_trade_data)
+    bulk_insert_analysis(test_db, [
+        {'trade_id': trade1.trade_id, 'timeframe_minutes': tf, 'bar_count': tf}
+        for tf in [3, 5, 10]
+    ])
+    test_db.commit()
+
+    counts = get_analysis_counts(test_db, [trade1.trade_id, trade2.trade_id])
+
+    assert counts == {trade1.trade_id: 3}
+
+
+def test_find_duplicate_trades(test_db, sample_trade_data, losing_trade_data):
+    """Test batch duplicate lookup by (symbol, entry, exit)."""
+    trade = create_trade(test_db, sample_trade_data)
+    test_db.commit()
+
+    key = (
+        sample_trade_data['symbol'],
+        sample_trade_data['entry_timestamp'],
+        sample_trade_data['exit_timestamp']
+    )
+    other = (
+        losing_trade_data['symbol'],
+        losing_trade_data['entry_timestamp'],
+        losing_trade_data['exit_timestamp']
+    )
+
+    assert find_duplicate_trades(test_db, [key, other]) == {key: trade.trade_id}
+
+
+def test_bulk_create_trades(test_db, sample_trade_data, losing_trade_data):
+    """Test multi-row trade insert returns IDs in input order."""
+    trade_ids = bulk_create_trades(test_db, [losing_trade_data, sample_trade_data])
+    test_db.commit()
+
+    assert len(trade_ids) == 2
+    assert get_trade_by_id(test_db, trade_ids[0]).symbol == losing_trade_data['symbol']
+    assert get_trade_by_id(test_db, trade_ids[1]).symbol == sample_trade_data['symbol']
+    assert bulk_create_trades(test_db, []) == []
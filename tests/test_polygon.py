@@ -356,6 +356,19 @@ class TestBarCache:
 
         assert cached_bars is None
 
+    def test_cache_entry_ttl_overrides_default(self, tmp_path):
+        """Test an entry's own TTL is honored over the cache default."""
+        cache = BarCache(cache_dir=str(tmp_path / "test_cache"), ttl_hours=0)
+        start = UTC_TZ.localize(datetime(2024, 1, 15, 14, 30))
+        end = UTC_TZ.localize(datetime(2024, 1, 15, 16, 0))
+        bars = [{'timestamp': start, 'open': 150, 'high': 151, 'low': 149, 'close': 150.5, 'volume': 10000}]
+
+        key = cache.get_cache_key('AAPL', start, end)
+        cache.set(key, bars, ttl_hours=24 * 365)
+
+        time.sleep(1)
+        assert cache.get(key) is not None
+
     def test_cache_stats(self, cache):
         """Test cache statistics."""
         # Empty cache